@@ -3,14 +3,104 @@
 Configuration management for MDX Server.
 """
 
+import copy
+import functools
 import json
 import logging
 import os
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
-
-
-@dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# 词典根目录：/dict (Docker) 或 dict (本地)，每个进程只检查一次
+_DICT_ROOT = "/dict" if os.path.isdir("/dict") else "dict"
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_dict_path(dict_path: str) -> str:
+    """Resolve a dictionary path against the detected dictionary root.
+
+    Only the candidate under the dictionary root is probed in the common
+    case; a missing file is reported later when the dictionary is loaded.
+    """
+    # 如果是绝对路径，直接返回
+    if os.path.isabs(dict_path):
+        return dict_path
+
+    candidate = os.path.join(_DICT_ROOT, dict_path)
+    if os.access(candidate, os.F_OK):
+        return candidate
+    # 当前目录相对路径
+    if os.access(dict_path, os.F_OK):
+        return dict_path
+    return candidate
+
+
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_SERVER_TYPES = frozenset({"simple", "threaded", "gevent", "gunicorn"})
+_LEVEL_NUMBERS = {name: logging.getLevelName(name) for name in _VALID_LOG_LEVELS}
+# (level, log_file) last applied by ServerConfig.setup_logging()
+_logging_setup: tuple[int, str | None] | None = None
+# Fields checked by ServerConfig.validate()
+_VALIDATED_FIELDS = frozenset(
+    {
+        "port",
+        "max_word_length",
+        "sqlite_mmap_size",
+        "log_level",
+        "server_type",
+        "max_threads",
+        "request_queue_size",
+        "gunicorn_workers",
+        "gunicorn_threads",
+    }
+)
+
+
+# Common spellings are matched as-is; anything else is lowercased first
+_TRUTHY = frozenset({"1", "true", "True", "TRUE", "yes", "on"})
+_FALSY = frozenset({"0", "false", "False", "FALSE", "no", "off", ""})
+
+
+def _parse_bool(value: str) -> bool:
+    """Convert an environment variable value to a boolean.
+
+    Accepts true/false, 1/0, yes/no and on/off in any case.
+    """
+    if value in _TRUTHY:
+        return True
+    if value in _FALSY:
+        return False
+    return value.strip().lower() in {"true", "1", "yes", "on"}
+
+
+# ServerConfig fields that may be overridden by MDX_* environment variables,
+# as (attribute, environment variable, converter for the raw string value).
+# The variable names are built once here rather than on every load.
+_ENV_OVERRIDES: tuple[tuple[str, str, Callable[[str], Any]], ...] = tuple(
+    (key, f"MDX_{key.upper()}", convert)
+    for key, convert in (
+        ("host", str),
+        ("port", int),
+        ("debug", _parse_bool),
+        ("dict_directory", str),
+        ("resource_directory", str),
+        ("cache_enabled", _parse_bool),
+        ("max_word_length", int),
+        ("sqlite_mmap_size", int),
+        ("log_level", str),
+        ("log_file", str),
+    )
+)
+
+
+@dataclass(slots=True, frozen=True)
 class DictConfig:
     """Single dictionary configuration."""
 
@@ -20,7 +110,7 @@ class DictConfig:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Server configuration with validation."""
 
@@ -30,7 +120,7 @@ class ServerConfig:
     debug: bool = False
 
     # Directory settings
-    dict_directory: str = "/dict" if Path("/dict").exists() else "dict"
+    dict_directory: str = _DICT_ROOT
     resource_directory: str = "mdx"
 
     # Multi-dictionary settings
@@ -39,13 +129,16 @@ class ServerConfig:
     # Performance settings
     cache_enabled: bool = True
     max_word_length: int = 100
+    sqlite_mmap_size: int = 256 * 1024 * 1024  # 0 disables SQLite mmap I/O
 
     # Logging settings
     log_level: str = "INFO"
     log_file: str | None = None
 
     # Concurrency settings
-    server_type: str = "threaded"  # "simple", "threaded", "gunicorn"
+    # "simple", "threaded", "gevent", "gunicorn". gevent is not monkey-patched:
+    # lookups block on sqlite3/mmap/file I/O, so it serves one request at a time
+    server_type: str = "threaded"
     max_threads: int = 20
     request_queue_size: int = 50
     connection_timeout: int = 30
@@ -67,10 +160,13 @@ class ServerConfig:
         if self.max_word_length < 1:
             raise ValueError("max_word_length must be positive")
 
-        if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
+        if self.sqlite_mmap_size < 0:
+            raise ValueError("sqlite_mmap_size must not be negative")
+
+        if self.log_level not in _VALID_LOG_LEVELS:
             raise ValueError(f"Invalid log level: {self.log_level}")
 
-        if self.server_type not in ["simple", "threaded", "gunicorn"]:
+        if self.server_type not in _VALID_SERVER_TYPES:
             raise ValueError(f"Invalid server type: {self.server_type}")
 
         if self.max_threads < 1:
@@ -88,24 +184,29 @@ class ServerConfig:
     @classmethod
     def from_file(cls, config_path: Path) -> "ServerConfig":
         """Load configuration from JSON file."""
-        if not config_path.exists():
+        try:
+            raw = config_path.read_bytes()
+        except FileNotFoundError:
             logging.warning(f"Config file not found: {config_path}, using defaults")
             return cls()
 
         try:
-            with open(config_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
             # 处理多词典配置
             if "dictionaries" in data:
                 # 创建临时配置实例用于路径解析
-                temp_config = cls(**{k: v for k, v in data.items() if k != "dictionaries"})
-                
+                temp_config = cls(
+                    **{k: v for k, v in data.items() if k != "dictionaries"}
+                )
+
                 dict_configs = {}
                 for dict_id, dict_data in data["dictionaries"].items():
                     if isinstance(dict_data, dict):
                         # 解析字典路径
-                        resolved_path = temp_config.resolve_dict_path(dict_data.get("path", ""))
+                        resolved_path = temp_config.resolve_dict_path(
+                            dict_data.get("path", "")
+                        )
                         dict_data_copy = dict_data.copy()
                         dict_data_copy["path"] = resolved_path
                         dict_configs[dict_id] = DictConfig(**dict_data_copy)
@@ -120,6 +221,7 @@ class ServerConfig:
                 data["dictionaries"] = dict_configs
 
             return cls(**data)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         except (json.JSONDecodeError, TypeError) as e:
             logging.error(f"Invalid config file {config_path}: {e}")
             return cls()
@@ -130,10 +232,10 @@ class ServerConfig:
         return cls(
             host=os.getenv("MDX_HOST", ""),
             port=int(os.getenv("MDX_PORT", "8000")),
-            debug=os.getenv("MDX_DEBUG", "false").lower() == "true",
+            debug=_parse_bool(os.getenv("MDX_DEBUG", "false")),
             dict_directory=os.getenv("MDX_DICT_DIR", "dict"),
             resource_directory=os.getenv("MDX_RESOURCE_DIR", "mdx"),
-            cache_enabled=os.getenv("MDX_CACHE", "true").lower() == "true",
+            cache_enabled=_parse_bool(os.getenv("MDX_CACHE", "true")),
             max_word_length=int(os.getenv("MDX_MAX_WORD_LENGTH", "100")),
             log_level=os.getenv("MDX_LOG_LEVEL", "INFO").upper(),
             log_file=os.getenv("MDX_LOG_FILE"),
@@ -142,58 +244,59 @@ class ServerConfig:
     def to_file(self, config_path: Path) -> None:
         """Save configuration to JSON file."""
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(asdict(self), f, indent=2)
+        if orjson is not None:
+            # orjson serializes (slotted) dataclasses natively; the
+            # OPT_SERIALIZE_DATACLASS flag is a no-op in orjson 3.x
+            config_path.write_bytes(orjson.dumps(self, option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_path, "w", encoding="utf-8") as f:
+                json.dump(self, f, indent=2, default=_json_default)
 
     def resolve_dict_path(self, dict_path: str) -> str:
         """Resolve dictionary path considering Docker and local environments."""
-        # 如果是绝对路径，直接返回
-        if Path(dict_path).is_absolute():
-            return dict_path
-        
-        # 相对路径处理：优先检查 /dict (Docker), 然后 dict (本地)
-        possible_paths = [
-            Path("/dict") / dict_path,  # Docker 环境
-            Path("dict") / dict_path,   # 本地环境
-            Path(dict_path),            # 当前目录相对路径
-        ]
-        
-        for path in possible_paths:
-            if path.exists():
-                return str(path)
-        
-        # 如果都不存在，根据环境返回最可能的路径
-        if Path("/dict").exists():
-            return str(Path("/dict") / dict_path)  # Docker 环境
-        else:
-            return str(Path("dict") / dict_path)   # 本地环境
+        return _resolve_dict_path(dict_path)
 
     def auto_discover_dictionaries(self) -> None:
         """Auto-discover MDX files if no dictionaries configured."""
         if self.dictionaries:
             return  # 已有配置，不自动发现
 
-        dict_path = Path(self.dict_directory)
-        if not dict_path.exists():
-            return
-
         # 扫描 MDX 文件
-        for mdx_file in dict_path.glob("*.mdx"):
-            dict_id = mdx_file.stem
-            route = dict_id if dict_id != "default" else ""
-
-            self.dictionaries[dict_id] = DictConfig(
-                name=dict_id.replace("_", " ").title(),
-                path=str(mdx_file),
-                route=route,
-                enabled=True,
-            )
+        try:
+            with os.scandir(self.dict_directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if not name.endswith(".mdx") or len(name) == 4:
+                        continue
+                    if not entry.is_file():
+                        continue
+                    dict_id = name[:-4]
+                    route = dict_id if dict_id != "default" else ""
+
+                    self.dictionaries[dict_id] = DictConfig(
+                        name=dict_id.replace("_", " ").title(),
+                        path=entry.path,
+                        route=route,
+                        enabled=True,
+                    )
+        except (FileNotFoundError, NotADirectoryError):
+            return
 
         logging.info(f"Auto-discovered {len(self.dictionaries)} dictionaries")
 
     def setup_logging(self) -> None:
-        """Setup logging based on configuration."""
-        level = getattr(logging, self.log_level)
+        """Setup logging based on configuration.
+
+        Repeated calls with the same level and log file are no-ops, so the
+        root handlers are not torn down and rebuilt each time.
+        """
+        global _logging_setup
+
+        # validate() guarantees log_level is one of the standard names
+        level = _LEVEL_NUMBERS[self.log_level]
+        setup = (level, self.log_file)
+        if setup == _logging_setup:
+            return
 
         handlers = []
 
@@ -215,75 +318,86 @@ class ServerConfig:
             handlers=handlers,
             force=True,
         )
+        _logging_setup = setup
 
 
 def load_config() -> ServerConfig:
-    """Load configuration from multiple sources with priority."""
+    """Load configuration from multiple sources with priority.
+
+    The result is cached per (config file, mtime, MDX_* environment), so
+    repeated calls skip parsing and validation. Each call returns its own
+    copy; use ``clear_config_cache()`` to drop the cache.
+    """
     # 配置文件查找优先级
     config_paths = [
         Path("/app/config.json"),  # 1. Docker 环境
         Path(__file__).parent.parent / "config.json",  # 2. 项目根目录 (开发环境)
         Path(__file__).parent / "config.json",  # 3. mdx_server/ 目录 (兼容旧版本)
     ]
-    
+
+    # One stat() per candidate both finds the file and yields its mtime
     config_file = None
+    mtime_ns = -1
     for path in config_paths:
-        if path.exists():
-            config_file = path
-            break
-    
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        config_file = path
+        break
+
     # 如果都找不到，使用默认配置
     if config_file is None:
         config_file = config_paths[1]  # 使用项目根目录作为默认路径
 
-    config = ServerConfig.from_file(config_file)
+    env_values = tuple(os.environ.get(env_key) for _, env_key, _ in _ENV_OVERRIDES)
+
+    config = _load_config_cached(str(config_file), mtime_ns, env_values)
+    return _copy_config(config)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    config_file: str, mtime_ns: int, env_values: tuple[str | None, ...]
+) -> ServerConfig:
+    """Build the configuration for a given config file and environment."""
+    config = ServerConfig.from_file(Path(config_file))
 
     # 2. Override with environment variables if set
-    env_overrides: dict[str, str | int | bool] = {}
-    for key in [
-        "host",
-        "port",
-        "debug",
-        "dict_directory",
-        "resource_directory",
-        "cache_enabled",
-        "max_word_length",
-        "log_level",
-        "log_file",
-    ]:
-        env_key = f"MDX_{key.upper()}"
-        if env_key in os.environ:
-            value = os.environ[env_key]
-
-            # Type conversion
-            if key in ["port", "max_word_length"]:
-                env_overrides[key] = int(value)
-            elif key in ["debug", "cache_enabled"]:
-                env_overrides[key] = value.lower() == "true"
-            else:
-                env_overrides[key] = value  # type: ignore[assignment]
-
-    # Apply overrides individually with type safety
-    if "host" in env_overrides:
-        config.host = env_overrides["host"]  # type: ignore[assignment]
-    if "port" in env_overrides:
-        config.port = env_overrides["port"]  # type: ignore[assignment]
-    if "debug" in env_overrides:
-        config.debug = env_overrides["debug"]  # type: ignore[assignment]
-    if "dict_directory" in env_overrides:
-        config.dict_directory = env_overrides["dict_directory"]  # type: ignore[assignment]
-    if "resource_directory" in env_overrides:
-        config.resource_directory = env_overrides["resource_directory"]  # type: ignore[assignment]
-    if "cache_enabled" in env_overrides:
-        config.cache_enabled = env_overrides["cache_enabled"]  # type: ignore[assignment]
-    if "max_word_length" in env_overrides:
-        config.max_word_length = env_overrides["max_word_length"]  # type: ignore[assignment]
-    if "log_level" in env_overrides:
-        config.log_level = env_overrides["log_level"]  # type: ignore[assignment]
-    if "log_file" in env_overrides:
-        config.log_file = env_overrides["log_file"]  # type: ignore[assignment]
-
-    # Validate final configuration
-    config.validate()
+    changed: set[str] = set()
+    for (key, _, convert), value in zip(_ENV_OVERRIDES, env_values, strict=True):
+        if value is not None:
+            setattr(config, key, convert(value))
+            changed.add(key)
 
+    # from_file already validated; re-check only if an override touched a
+    # validated field
+    if changed & _VALIDATED_FIELDS:
+        config.validate()
+
+    return config
+
+
+def _copy_config(config: ServerConfig) -> ServerConfig:
+    """Return a caller-owned copy of an already validated cached config.
+
+    copy.copy() skips __post_init__, so the copy is not validated again.
+    Callers may mutate the result; DictConfig itself is frozen, so only the
+    dictionaries mapping needs copying.
+    """
+    config = copy.copy(config)
+    config.dictionaries = dict(config.dictionaries)
     return config
+
+
+def _json_default(obj: Any) -> dict[str, Any]:
+    """Serialize config dataclasses field by field, without asdict() copies."""
+    if isinstance(obj, ServerConfig | DictConfig):
+        return {name: getattr(obj, name) for name in obj.__slots__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def clear_config_cache() -> None:
+    """Drop cached configurations so the next load_config() re-reads them."""
+    _load_config_cached.cache_clear()
+    _resolve_dict_path.cache_clear()
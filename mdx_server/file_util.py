@@ -6,6 +6,9 @@ Provides efficient file I/O operations with proper error handling
 and type safety for Python 3.13+.
 """
 
+import functools
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 
@@ -35,12 +38,32 @@ def read_text_lines_stripped(path: str | Path) -> list[str]:
     Returns:
         List of stripped lines from the file
 
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        UnicodeDecodeError: If the file has encoding issues
+    """
+    return list(iter_text_lines_stripped(path))
+
+
+def iter_text_lines_stripped(path: str | Path) -> Iterator[str]:
+    """Lazily yield stripped lines from a text file.
+
+    Unlike read_text_lines_stripped, only one line is held in memory at a
+    time, which suits large files that are consumed in a single pass.
+
+    Args:
+        path: Path to the text file
+
+    Yields:
+        Stripped lines from the file
+
     Raises:
         FileNotFoundError: If the file doesn't exist
         UnicodeDecodeError: If the file has encoding issues
     """
     with open(path, encoding="utf-8") as f:
-        return [line.strip() for line in f]
+        for line in f:
+            yield line.strip()
 
 
 def read_text(path: str | Path) -> str:
@@ -56,8 +79,7 @@ def read_text(path: str | Path) -> str:
         FileNotFoundError: If the file doesn't exist
         UnicodeDecodeError: If the file has encoding issues
     """
-    with open(path, encoding="utf-8") as f:
-        return f.read()
+    return Path(path).read_text(encoding="utf-8")
 
 
 def write_text(path: str | Path, text: str) -> None:
@@ -89,8 +111,7 @@ def read_bytes(path: str | Path) -> bytes:
         FileNotFoundError: If the file doesn't exist
         OSError: If other I/O error occurs
     """
-    with open(path, "rb") as f:
-        return f.read()
+    return Path(path).read_bytes()
 
 
 def get_file_extension(path: str | Path) -> str:
@@ -105,8 +126,18 @@ def get_file_extension(path: str | Path) -> str:
     Example:
         >>> get_file_extension("/path/file.txt")
         'txt'
+
+    Note:
+        Results are memoized by path string; Path objects are converted
+        with os.fspath() before the cache lookup.
     """
-    return Path(path).suffix[1:] if Path(path).suffix else ""
+    return _extension_of(os.fspath(path))
+
+
+@functools.lru_cache(maxsize=1024)
+def _extension_of(s: str) -> str:
+    """Return the extension of a path string (cached)."""
+    return os.path.splitext(s)[1][1:]
 
 
 def get_filename(path: str | Path) -> str:
@@ -139,7 +170,13 @@ def has_extension(path: str | Path, ext: str) -> bool:
         >>> has_extension("/path/file.txt", "txt")
         True
     """
-    return get_file_extension(path).lower() == ext.lower()
+    return _has_extension(os.fspath(path), ext.lower())
+
+
+@functools.lru_cache(maxsize=1024)
+def _has_extension(s: str, ext_lower: str) -> bool:
+    """Check a path string against a lowercased extension (cached)."""
+    return _extension_of(s).lower() == ext_lower
 
 
 def get_all_files(root_dir: str | Path) -> list[str]:
@@ -162,7 +199,41 @@ def get_all_files(root_dir: str | Path) -> list[str]:
     if not root_path.is_dir():
         raise NotADirectoryError(f"Path is not a directory: {root_dir}")
 
-    return [str(p) for p in root_path.rglob("*") if p.is_file()]
+    return list(_walk_files(str(root_path)))
+
+
+def iter_files(root_dir: str | Path) -> Iterator[str]:
+    """Lazily yield all file paths under a directory, recursively.
+
+    Unlike get_all_files, paths are produced one at a time during the walk,
+    so single-pass consumers never hold the full list.
+
+    Args:
+        root_dir: Root directory to search
+
+    Yields:
+        File paths found under root_dir
+
+    Raises:
+        FileNotFoundError: If root directory doesn't exist
+    """
+    return _walk_files(os.fspath(root_dir))
+
+
+def _walk_files(root: str) -> Iterator[str]:
+    """Yield file paths under root using a stack-based os.scandir walk.
+
+    DirEntry type checks are answered from the readdir data, avoiding the
+    extra stat() and Path allocation per entry that rglob incurs.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
 
 
 def path_exists(path: str | Path) -> bool:
@@ -218,11 +289,18 @@ def delete_files_by_extension(directory: str | Path, ext: str) -> int:
     if not dir_path.exists():
         raise FileNotFoundError(f"Directory does not exist: {directory}")
 
+    suffix = f".{ext}"
     deleted_count = 0
-    for file_path in dir_path.rglob(f"*.{ext}"):
-        if file_path.is_file():
-            file_path.unlink()
-            deleted_count += 1
+    stack = [str(dir_path)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                # Cheap name check first so non-matching entries skip is_file()
+                elif entry.name.endswith(suffix) and entry.is_file():
+                    os.unlink(entry.path)
+                    deleted_count += 1
 
     return deleted_count
 
@@ -230,7 +308,8 @@ def delete_files_by_extension(directory: str | Path, ext: str) -> int:
 # Backward compatibility aliases - deprecated, use new names instead
 def file_util_get_files(root_dir: str | Path, result_list: list[str]) -> None:
     """Deprecated: Use get_all_files() instead."""
-    result_list.extend(get_all_files(root_dir))
+    # Extend straight from the walker; no intermediate list
+    result_list.extend(_walk_files(os.fspath(root_dir)))
 
 
 file_util_read_text = read_text
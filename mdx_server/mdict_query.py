@@ -9,10 +9,15 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
 import os
 import re
 import sqlite3
+import threading
 import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import closing
 from pathlib import Path
 
 # from struct import pack  # Unused after modernization
@@ -20,7 +25,83 @@ from .readmdict import MDD, MDX
 
 # Note: LZO compression support has been removed as it's rarely used in modern MDX files
 
-version = "1.1"
+# Index schema version; databases with another version are rebuilt
+version = "1.2"
+
+# Default SQLite memory-map window for index databases (256 MiB)
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+
+# Stylesheet markers in record text, e.g. `1`
+_STYLE_TAG_RE = re.compile(r"`(\d+)`")
+
+# MDX_INDEX columns that describe a record, in the order lookups unpack them
+_INDEX_COLUMNS = (
+    "key_text, file_pos, compressed_size, decompressed_size, "
+    "record_block_type, record_start, record_end, offset"
+)
+
+# Number of inflated record blocks kept per IndexBuilder
+_BLOCK_CACHE_SIZE = 128
+
+# Rows fetched per lock acquisition when iterating over keys
+_KEY_BATCH_SIZE = 1000
+
+# Stay below SQLite's default host-parameter limit in batched queries
+_MAX_SQL_VARIABLES = 500
+
+
+def _index_rows(index_list: list[dict]) -> Iterator[tuple]:
+    """Yield MDX_INDEX rows from parser index dicts without building a list."""
+    for item in index_list:
+        yield (
+            item["key_text"],
+            item["file_pos"],
+            item["compressed_size"],
+            item["decompressed_size"],
+            item["record_block_type"],
+            item["record_start"],
+            item["record_end"],
+            item["offset"],
+            # Reversed key, so suffix queries can use an index
+            item["key_text"][::-1],
+        )
+
+
+def _glob_clause(query: str) -> tuple[str, str]:
+    """Translate a key query into an index-friendly GLOB clause.
+
+    A plain query is a prefix match; ``*`` is a wildcard. A pure suffix
+    query such as ``*tion`` is matched against the reversed key column
+    so it becomes a prefix match there too.
+    """
+    if "*" not in query:
+        return "key_text GLOB ?", query + "*"
+    suffix = query[1:]
+    if query[0] == "*" and not any(ch in suffix for ch in "*?["):
+        return "key_rev GLOB ?", suffix[::-1] + "*"
+    return "key_text GLOB ?", query
+
+
+def _index_location(index: dict) -> tuple:
+    """Return the _decompress_record_block arguments from an index dict."""
+    return (
+        index["file_pos"],
+        index["compressed_size"],
+        index["decompressed_size"],
+        index["record_block_type"],
+        index["record_start"],
+        index["record_end"],
+        index["offset"],
+    )
+
+
+def _map_file(path: str) -> mmap.mmap:
+    """Memory-map a dictionary file read-only for random record access."""
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_RANDOM"):
+        mm.madvise(mmap.MADV_RANDOM)
+    return mm
 
 
 class IndexBuilder:
@@ -35,11 +116,17 @@ class IndexBuilder:
         enable_history: bool = False,
         sql_index: bool = True,
         check: bool = False,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
     ) -> None:
-        """Initialize IndexBuilder with modern type hints and documentation."""
+        """Initialize IndexBuilder with modern type hints and documentation.
+
+        ``mmap_size`` sets SQLite's ``PRAGMA mmap_size`` for index reads;
+        use 0 to disable memory-mapped I/O (e.g. on spinning disks).
+        """
         self._initialize_attributes()
         self._sql_index = sql_index
         self._check = check
+        self._mmap_size = mmap_size
 
         self._validate_and_set_paths(fname)
 
@@ -48,17 +135,35 @@ class IndexBuilder:
         else:
             self._load_or_create_indexes()
 
+        self._open_handles()
+
     def _initialize_attributes(self) -> None:
         """Initialize instance attributes."""
         self._mdx_file = ""
         self._mdd_file = ""
         self._encoding = ""
         self._stylesheet: dict[str, tuple[str, str]] = {}
+        # Stylesheet split into open/close lists indexed by int(tag)
+        self._style_open: list[str] = []
+        self._style_close: list[str] = []
         self._title = ""
         self._version = ""
         self._description = ""
         self._mdx_db = ""
         self._mdd_db = ""
+        # Long-lived handles, opened once the indexes exist
+        self._mdx_conn: sqlite3.Connection | None = None
+        self._mdd_conn: sqlite3.Connection | None = None
+        self._mdx_mmap: mmap.mmap | None = None
+        self._mdd_mmap: mmap.mmap | None = None
+        # Reused lookup cursors, one per connection
+        self._mdx_cursor: sqlite3.Cursor | None = None
+        self._mdd_cursor: sqlite3.Cursor | None = None
+        # Serializes use of the shared SQLite connections across threads
+        self._db_lock = threading.Lock()
+        # Recently inflated record blocks, least recently used first
+        self._block_cache: OrderedDict[tuple[int, int, int], bytes] = OrderedDict()
+        self._block_cache_lock = threading.Lock()
 
     def _validate_and_set_paths(self, fname: str | Path) -> None:
         """Validate MDX file and set up paths."""
@@ -84,6 +189,65 @@ class IndexBuilder:
         if self._mdd_file:
             self._make_mdd_index(self._mdd_db)
 
+    def _connect(self, db_name: str, readonly: bool = True) -> sqlite3.Connection:
+        """Open an SQLite connection tuned for the index databases.
+
+        Read connections run with ``query_only`` set. Write connections are
+        only used for one-off index builds into a freshly created file, so
+        journaling and fsync are switched off; callers manage the single
+        BEGIN/COMMIT transaction themselves.
+        """
+        conn = sqlite3.connect(
+            db_name, isolation_level=None, check_same_thread=not readonly
+        )
+        pragmas = [
+            f"PRAGMA mmap_size={int(self._mmap_size)}",
+            "PRAGMA temp_store=MEMORY",
+        ]
+        if readonly:
+            pragmas += ["PRAGMA cache_size=-65536", "PRAGMA query_only=1"]
+        else:
+            pragmas += [
+                "PRAGMA cache_size=-200000",
+                "PRAGMA journal_mode=OFF",
+                "PRAGMA synchronous=OFF",
+                "PRAGMA locking_mode=EXCLUSIVE",
+            ]
+        conn.executescript(";".join(pragmas))
+        return conn
+
+    def _open_handles(self) -> None:
+        """Open the SQLite connections and memory-map the MDX/MDD files."""
+        self._mdx_conn = self._connect(self._mdx_db)
+        self._mdx_cursor = self._mdx_conn.cursor()
+        self._mdx_mmap = _map_file(self._mdx_file)
+        if self._mdd_file:
+            self._mdd_conn = self._connect(self._mdd_db)
+            self._mdd_cursor = self._mdd_conn.cursor()
+            self._mdd_mmap = _map_file(self._mdd_file)
+
+    def close(self) -> None:
+        """Close database connections and unmap dictionary files."""
+        with self._db_lock:
+            for conn in (self._mdx_conn, self._mdd_conn):
+                if conn is not None:
+                    conn.close()
+            for mm in (self._mdx_mmap, self._mdd_mmap):
+                if mm is not None:
+                    mm.close()
+            self._mdx_conn = self._mdd_conn = None
+            self._mdx_cursor = self._mdd_cursor = None
+            self._mdx_mmap = self._mdd_mmap = None
+        with self._block_cache_lock:
+            self._block_cache.clear()
+
+    def __del__(self) -> None:
+        """Release handles when the builder is garbage collected."""
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def _load_or_create_indexes(self) -> None:
         """Load existing indexes or create new ones."""
         if os.path.isfile(self._mdx_db):
@@ -107,13 +271,15 @@ class IndexBuilder:
             True if metadata loaded successfully, False if rebuild needed.
         """
         try:
-            with sqlite3.connect(self._mdx_db) as conn:
+            with closing(self._connect(self._mdx_db)) as conn:
                 # Check version info
                 cursor = conn.execute('SELECT value FROM META WHERE key = "version"')
                 if row := cursor.fetchone():
                     self._version = row[0]
                 else:
                     return False  # No version info, need rebuild
+                if self._version != version:
+                    return False  # Built with an older schema
 
                 # Get encoding
                 cursor = conn.execute(
@@ -127,7 +293,7 @@ class IndexBuilder:
                     "SELECT value FROM META WHERE key = ?", ("stylesheet",)
                 )
                 if row := cursor.fetchone():
-                    self._stylesheet = json.loads(row[0])
+                    self._set_stylesheet(json.loads(row[0]))
 
                 # Get title
                 cursor = conn.execute(
@@ -150,7 +316,7 @@ class IndexBuilder:
 
     def _rebuild_mdx_index(self) -> None:
         """Rebuild MDX index and MDD if exists."""
-        logging.info("Version info not found, rebuilding index")
+        logging.info("Index version missing or outdated, rebuilding index")
         self._make_mdx_index(self._mdx_db)
         logging.info("mdx.db rebuilt")
 
@@ -158,28 +324,41 @@ class IndexBuilder:
             self._make_mdd_index(self._mdd_db)
             logging.info("mdd.db rebuilt")
 
+    def _set_stylesheet(self, stylesheet: dict[str, tuple[str, str]]) -> None:
+        """Store the stylesheet and its list-indexed open/close tags."""
+        self._stylesheet = stylesheet
+        size = max(map(int, stylesheet), default=-1) + 1
+        self._style_open = [""] * size
+        self._style_close = [""] * size
+        for tag, (style_open, style_close) in stylesheet.items():
+            self._style_open[int(tag)] = style_open
+            self._style_close[int(tag)] = style_close
+
     def _replace_stylesheet(self, txt):
         # substitute stylesheet definition
-        txt_list = re.split(r"`\d+`", txt)
-        txt_tag = re.findall(r"`\d+`", txt)
-        txt_styled = txt_list[0]
-        for j, p in enumerate(txt_list[1:]):
-            style = self._stylesheet[txt_tag[j][1:-1]]
+        # One split with a capture group yields [text, tag, text, tag, ...]
+        parts = _STYLE_TAG_RE.split(txt)
+        style_open, style_close = self._style_open, self._style_close
+        styled = [parts[0]]
+        for j in range(1, len(parts), 2):
+            i = int(parts[j])
+            p = parts[j + 1]
             if p and p[-1] == "\n":
-                txt_styled = txt_styled + style[0] + p.rstrip() + style[1] + "\r\n"
+                styled += (style_open[i], p.rstrip(), style_close[i], "\r\n")
             else:
-                txt_styled = txt_styled + style[0] + p + style[1]
-        return txt_styled
+                styled += (style_open[i], p, style_close[i])
+        return "".join(styled)
 
     def _make_mdx_index(self, db_name):
         if os.path.exists(db_name):
             os.remove(db_name)
-        mdx = MDX(self._mdx_file)
+        mdx = MDX(self._mdx_file, verify=self._check)
         self._mdx_db = db_name
         returned_index = mdx.get_index(check_block=self._check)
         index_list = returned_index["index_dict_list"]
-        conn = sqlite3.connect(db_name)
+        conn = self._connect(db_name, readonly=False)
         c = conn.cursor()
+        c.execute("BEGIN")
         c.execute(
             """ CREATE TABLE MDX_INDEX
                (key_text text not null,
@@ -189,24 +368,14 @@ class IndexBuilder:
                 record_block_type integer,
                 record_start integer,
                 record_end integer,
-                offset integer
+                offset integer,
+                key_rev text
                 )"""
         )
 
-        tuple_list = [
-            (
-                item["key_text"],
-                item["file_pos"],
-                item["compressed_size"],
-                item["decompressed_size"],
-                item["record_block_type"],
-                item["record_start"],
-                item["record_end"],
-                item["offset"],
-            )
-            for item in index_list
-        ]
-        c.executemany("INSERT INTO MDX_INDEX VALUES (?,?,?,?,?,?,?,?)", tuple_list)
+        c.executemany(
+            "INSERT INTO MDX_INDEX VALUES (?,?,?,?,?,?,?,?,?)", _index_rows(index_list)
+        )
         # build the metadata table
         meta = returned_index["meta"]
         c.execute(
@@ -239,23 +408,26 @@ class IndexBuilder:
                 CREATE INDEX key_index ON MDX_INDEX (key_text)
                 """
             )
+            c.execute("CREATE INDEX key_rev_index ON MDX_INDEX (key_rev)")
 
-        conn.commit()
+        c.execute("COMMIT")
         conn.close()
         # set class member
+        self._version = version
         self._encoding = meta["encoding"]
-        self._stylesheet = json.loads(meta["stylesheet"])
+        self._set_stylesheet(json.loads(meta["stylesheet"]))
         self._title = meta["title"]
         self._description = meta["description"]
 
     def _make_mdd_index(self, db_name):
         if os.path.exists(db_name):
             os.remove(db_name)
-        mdd = MDD(self._mdd_file)
+        mdd = MDD(self._mdd_file, verify=self._check)
         self._mdd_db = db_name
         index_list = mdd.get_index(check_block=self._check)
-        conn = sqlite3.connect(db_name)
+        conn = self._connect(db_name, readonly=False)
         c = conn.cursor()
+        c.execute("BEGIN")
         c.execute(
             """ CREATE TABLE MDX_INDEX
                (key_text text not null unique,
@@ -265,40 +437,47 @@ class IndexBuilder:
                 record_block_type integer,
                 record_start integer,
                 record_end integer,
-                offset integer
+                offset integer,
+                key_rev text
                 )"""
         )
 
-        tuple_list = [
-            (
-                item["key_text"],
-                item["file_pos"],
-                item["compressed_size"],
-                item["decompressed_size"],
-                item["record_block_type"],
-                item["record_start"],
-                item["record_end"],
-                item["offset"],
-            )
-            for item in index_list
-        ]
-        c.executemany("INSERT INTO MDX_INDEX VALUES (?,?,?,?,?,?,?,?)", tuple_list)
+        c.executemany(
+            "INSERT INTO MDX_INDEX VALUES (?,?,?,?,?,?,?,?,?)", _index_rows(index_list)
+        )
         if self._sql_index:
             c.execute(
                 """
                 CREATE UNIQUE INDEX key_index ON MDX_INDEX (key_text)
                 """
             )
+            c.execute("CREATE INDEX key_rev_index ON MDX_INDEX (key_rev)")
 
-        conn.commit()
+        c.execute("COMMIT")
         conn.close()
 
-    def _decompress_record_block(self, file_handle, index: dict) -> bytes:
-        """Extract and decompress record block from file.
+    def _decompress_record_block(
+        self,
+        mm,
+        file_pos: int,
+        compressed_size: int,
+        decompressed_size: int,
+        record_block_type: int,
+        record_start: int,
+        record_end: int,
+        offset: int,
+    ) -> bytes:
+        """Extract and decompress record block from a mapped file.
 
         Args:
-            file_handle: Open file handle
-            index: Index information dict
+            mm: Memory-mapped dictionary file
+            file_pos: Offset of the record block in the file
+            compressed_size: Size of the record block including its header
+            decompressed_size: Size of the inflated record block
+            record_block_type: Compression type (0 none, 1 LZO, 2 zlib)
+            record_start: Start of the record, relative to the dictionary
+            record_end: End of the record, relative to the dictionary
+            offset: Dictionary offset of the decompressed block
 
         Returns:
             Decompressed record block data
@@ -306,67 +485,95 @@ class IndexBuilder:
         Raises:
             RuntimeError: If LZO compression not supported
         """
-        file_handle.seek(index["file_pos"])
-        record_block_compressed = file_handle.read(index["compressed_size"])
-        record_block_type = index["record_block_type"]
-        # decompressed_size is not used but kept for clarity
-        _ = index["decompressed_size"]
+        # zlib is by far the most common block type, so test it first and
+        # return straight from the fast path
+        if record_block_type == 2:
+            record_block = self._inflate_block(
+                mm, file_pos, compressed_size, decompressed_size
+            )
+            return record_block[record_start - offset : record_end - offset]
 
         if record_block_type == 0:
-            # No compression
-            record_block = record_block_compressed[8:]
+            # No compression: skip the 8-byte block header (compression
+            # type + adler32) and copy just the record out of the mapping
+            start = file_pos + 8
+            return mm[start + record_start - offset : start + record_end - offset]
         elif record_block_type == 1:
             # LZO compression is no longer supported
             raise RuntimeError(
                 "LZO compressed record block detected. LZO support has been removed. "
                 "Please use a more modern MDX file format with zlib compression."
             )
-        elif record_block_type == 2:
-            # zlib compression
-            record_block = zlib.decompress(record_block_compressed[8:])
-        else:
-            raise ValueError(f"Unknown compression type: {record_block_type}")
+        raise ValueError(f"Unknown compression type: {record_block_type}")
 
-        # Extract the specific record from the block
-        return record_block[
-            index["record_start"] - index["offset"] : index["record_end"]
-            - index["offset"]
-        ]
+    def _inflate_block(
+        self, mm, file_pos: int, compressed_size: int, decompressed_size: int
+    ) -> bytes:
+        """Inflate a zlib record block, reusing recently inflated blocks.
+
+        A block holds many records, and one page (entry, links, CSS, images)
+        often touches the same block repeatedly.
+        """
+        key = (id(mm), file_pos, compressed_size)
+        with self._block_cache_lock:
+            block = self._block_cache.get(key)
+            if block is not None:
+                self._block_cache.move_to_end(key)
+                return block
+
+        # Inflate the raw deflate stream past the 8-byte block header and
+        # 2-byte zlib header straight from the mapping: no intermediate copy
+        # of the compressed block, and no second Adler-32 pass (the block
+        # header carries its own checksum, verified when indexing with
+        # check=True).
+        start = file_pos + 8
+        with memoryview(mm)[start + 2 : file_pos + compressed_size] as data:
+            block = zlib.decompress(
+                data, -zlib.MAX_WBITS, bufsize=max(decompressed_size, 1)
+            )
+
+        with self._block_cache_lock:
+            self._block_cache[key] = block
+            if len(self._block_cache) > _BLOCK_CACHE_SIZE:
+                self._block_cache.popitem(last=False)
+        return block
+
+    def _decode_mdx_record(self, record: bytes) -> str:
+        """Decode a raw MDX record and apply the stylesheet."""
+        # Decode once and keep the record as str from here on
+        text = record.decode(self._encoding, errors="ignore").strip("\x00")
+
+        # Apply stylesheet if available; most records carry no `N` markers
+        if self._stylesheet and "`" in text:
+            text = self._replace_stylesheet(text)
+
+        return text
 
     def get_mdx_by_index(self, fmdx, index: dict) -> str:
         """Get MDX record by index with text processing.
 
         Args:
-            fmdx: Open MDX file handle
+            fmdx: Memory-mapped MDX file
             index: Index information dict
 
         Returns:
             Processed text record
         """
-        record = self._decompress_record_block(fmdx, index)
-
-        # Decode and process text
-        record = (
-            record.decode(self._encoding, errors="ignore").strip("\x00").encode("utf-8")
+        return self._decode_mdx_record(
+            self._decompress_record_block(fmdx, *_index_location(index))
         )
 
-        # Apply stylesheet if available
-        if self._stylesheet:
-            record = self._replace_stylesheet(record)
-
-        return record.decode("utf-8")
-
     def get_mdd_by_index(self, fmdx, index: dict) -> bytes:
         """Get MDD resource by index (binary data).
 
         Args:
-            fmdx: Open MDD file handle
+            fmdx: Memory-mapped MDD file
             index: Index information dict
 
         Returns:
             Raw binary data
         """
-        return self._decompress_record_block(fmdx, index)
+        return self._decompress_record_block(fmdx, *_index_location(index))
 
     def mdx_lookup(self, keyword: str) -> list[str]:
         """Look up keyword in MDX index with proper resource management.
@@ -388,26 +595,23 @@ class IndexBuilder:
         lookup_result_list = []
 
         try:
-            with sqlite3.connect(self._mdx_db) as conn:
+            with self._db_lock:
                 # Use parameterized query to prevent SQL injection
-                cursor = conn.execute(
-                    "SELECT * FROM MDX_INDEX WHERE key_text = ?", (keyword,)
+                rows = self._mdx_cursor.execute(  # type: ignore[union-attr]
+                    f"SELECT {_INDEX_COLUMNS} FROM MDX_INDEX WHERE key_text = ?",
+                    (keyword,),
+                ).fetchall()
+
+            mm = self._mdx_mmap
+            for result in rows:
+                # Columns: key_text, file_pos, compressed_size,
+                # decompressed_size, record_block_type, record_start,
+                # record_end, offset
+                _, file_pos, csize, dsize, rbtype, rstart, rend, offset = result
+                record = self._decompress_record_block(
+                    mm, file_pos, csize, dsize, rbtype, rstart, rend, offset
                 )
-
-                with open(self._mdx_file, "rb") as mdx_file:
-                    for result in cursor:
-                        index = {
-                            "file_pos": result[1],
-                            "compressed_size": result[2],
-                            "decompressed_size": result[3],
-                            "record_block_type": result[4],
-                            "record_start": result[5],
-                            "record_end": result[6],
-                            "offset": result[7],
-                        }
-                        lookup_result_list.append(
-                            self.get_mdx_by_index(mdx_file, index)
-                        )
+                lookup_result_list.append(self._decode_mdx_record(record))
 
         except sqlite3.Error as e:
             logging.error(f"Database error during MDX lookup for '{keyword}': {e}")
@@ -421,6 +625,57 @@ class IndexBuilder:
 
         return lookup_result_list
 
+    def _fetch_index_rows(
+        self, cursor: sqlite3.Cursor | None, keywords: list[str]
+    ) -> list[tuple]:
+        """Fetch index rows for several keys with chunked ``IN (...)`` queries."""
+        unique_keys = list(dict.fromkeys(k for k in keywords if k))
+        if cursor is None or not unique_keys:
+            return []
+
+        rows: list[tuple] = []
+        with self._db_lock:
+            for start in range(0, len(unique_keys), _MAX_SQL_VARIABLES):
+                batch = unique_keys[start : start + _MAX_SQL_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+                rows.extend(
+                    cursor.execute(
+                        f"SELECT {_INDEX_COLUMNS} FROM MDX_INDEX "
+                        f"WHERE key_text IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                )
+        return rows
+
+    def mdx_lookup_many(self, keywords: list[str]) -> dict[str, list[str]]:
+        """Look up several keywords with batched ``IN (...)`` queries.
+
+        Args:
+            keywords: Words to look up in dictionary
+
+        Returns:
+            Mapping of each found keyword to its definitions, in the same
+            order mdx_lookup would return them. Missing keywords are omitted.
+
+        Raises:
+            sqlite3.Error: If database operation fails
+            OSError: If file I/O fails
+        """
+        try:
+            rows = self._fetch_index_rows(self._mdx_cursor, keywords)
+        except sqlite3.Error as e:
+            logging.error(f"Database error during batched MDX lookup: {e}")
+            raise
+
+        results: dict[str, list[str]] = {}
+        mm = self._mdx_mmap
+        for key, file_pos, csize, dsize, rbtype, rstart, rend, offset in rows:
+            record = self._decompress_record_block(
+                mm, file_pos, csize, dsize, rbtype, rstart, rend, offset
+            )
+            results.setdefault(key, []).append(self._decode_mdx_record(record))
+        return results
+
     def mdd_lookup(self, keyword: str) -> list[bytes]:
         """Look up resource in MDD index with proper resource management.
 
@@ -435,33 +690,28 @@ class IndexBuilder:
             FileNotFoundError: If MDD file not found
             OSError: If file I/O fails
         """
-        if not keyword or not hasattr(self, "_mdd_db") or not self._mdd_db:
+        if not keyword or self._mdd_conn is None:
             return []
 
         lookup_result_list = []
 
         try:
-            with sqlite3.connect(self._mdd_db) as conn:
+            with self._db_lock:
                 # Use parameterized query to prevent SQL injection
-                cursor = conn.execute(
-                    "SELECT * FROM MDX_INDEX WHERE key_text = ?", (keyword,)
+                rows = self._mdd_cursor.execute(  # type: ignore[union-attr]
+                    f"SELECT {_INDEX_COLUMNS} FROM MDX_INDEX WHERE key_text = ?",
+                    (keyword,),
+                ).fetchall()
+
+            mm = self._mdd_mmap
+            for result in rows:
+                _, file_pos, csize, dsize, rbtype, rstart, rend, offset = result
+                lookup_result_list.append(
+                    self._decompress_record_block(
+                        mm, file_pos, csize, dsize, rbtype, rstart, rend, offset
+                    )
                 )
 
-                with open(self._mdd_file, "rb") as mdd_file:
-                    for result in cursor:
-                        index = {
-                            "file_pos": result[1],
-                            "compressed_size": result[2],
-                            "decompressed_size": result[3],
-                            "record_block_type": result[4],
-                            "record_start": result[5],
-                            "record_end": result[6],
-                            "offset": result[7],
-                        }
-                        lookup_result_list.append(
-                            self.get_mdd_by_index(mdd_file, index)
-                        )
-
         except sqlite3.Error as e:
             logging.error(f"Database error during MDD lookup for '{keyword}': {e}")
             raise
@@ -474,33 +724,114 @@ class IndexBuilder:
 
         return lookup_result_list
 
+    def _iter_keys(
+        self, conn: sqlite3.Connection | None, query: str, limit: int | None
+    ) -> Iterator[str]:
+        """Yield matching keys from one index database in batches.
+
+        The lock is only held while a batch is fetched, so callers may run
+        lookups on the same builder while consuming the iterator.
+        """
+        if conn is None:
+            return
+
+        sql = "SELECT key_text FROM MDX_INDEX"
+        params: list = []
+        if query:
+            clause, pattern = _glob_clause(query)
+            sql += f" WHERE {clause}"
+            params.append(pattern)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._db_lock:
+            cursor = conn.execute(sql, params)
+        try:
+            while True:
+                with self._db_lock:
+                    rows = cursor.fetchmany(_KEY_BATCH_SIZE)
+                if not rows:
+                    return
+                for row in rows:
+                    yield row[0]
+        finally:
+            cursor.close()
+
+    def iter_mdd_keys(self, query: str = "", limit: int | None = None) -> Iterator[str]:
+        """Lazily yield MDD keys with optional query pattern.
+
+        Args:
+            query: Optional query pattern. Use * for wildcards; matching
+                is case-sensitive.
+            limit: Optional maximum number of keys, applied in SQL.
+
+        Yields:
+            Matching keys.
+
+        Raises:
+            sqlite3.Error: If database operation fails
+        """
+        return self._iter_keys(self._mdd_conn, query, limit)
+
+    def iter_mdx_keys(self, query: str = "", limit: int | None = None) -> Iterator[str]:
+        """Lazily yield MDX keys with optional query pattern.
+
+        Args:
+            query: Optional query pattern. Use * for wildcards; matching
+                is case-sensitive.
+            limit: Optional maximum number of keys, applied in SQL.
+
+        Yields:
+            Matching keys.
+
+        Raises:
+            sqlite3.Error: If database operation fails
+        """
+        return self._iter_keys(self._mdx_conn, query, limit)
+
+    def mdd_lookup_many(self, keywords: list[str]) -> dict[str, list[bytes]]:
+        """Look up several resource paths with batched ``IN (...)`` queries.
+
+        Args:
+            keywords: Resource paths to look up
+
+        Returns:
+            Mapping of each found path to its resource data. Missing paths
+            are omitted.
+
+        Raises:
+            sqlite3.Error: If database operation fails
+            OSError: If file I/O fails
+        """
+        try:
+            rows = self._fetch_index_rows(self._mdd_cursor, keywords)
+        except sqlite3.Error as e:
+            logging.error(f"Database error during batched MDD lookup: {e}")
+            raise
+
+        results: dict[str, list[bytes]] = {}
+        mm = self._mdd_mmap
+        for key, file_pos, csize, dsize, rbtype, rstart, rend, offset in rows:
+            results.setdefault(key, []).append(
+                self._decompress_record_block(
+                    mm, file_pos, csize, dsize, rbtype, rstart, rend, offset
+                )
+            )
+        return results
+
     def get_mdd_keys(self, query=""):
         """Get MDD keys with optional query pattern.
 
         Args:
-            query: Optional query pattern. Use * for wildcards.
+            query: Optional query pattern. Use * for wildcards; matching
+                is case-sensitive.
 
         Returns:
             List of matching keys.
         """
-        if not self._mdd_db:
-            return []
-
         try:
-            with sqlite3.connect(self._mdd_db) as conn:
-                if query:
-                    if "*" in query:
-                        query = query.replace("*", "%")
-                    else:
-                        query = query + "%"
-                    cursor = conn.execute(
-                        "SELECT key_text FROM MDX_INDEX WHERE key_text LIKE ?", (query,)
-                    )
-                    keys = [item[0] for item in cursor]
-                else:
-                    cursor = conn.execute("SELECT key_text FROM MDX_INDEX")
-                    keys = [item[0] for item in cursor]
-                return keys
+            return list(self.iter_mdd_keys(query))
         except sqlite3.Error as e:
             logging.error(f"Database error during MDD keys query '{query}': {e}")
             return []
@@ -509,26 +840,14 @@ class IndexBuilder:
         """Get MDX keys with optional query pattern.
 
         Args:
-            query: Optional query pattern. Use * for wildcards.
+            query: Optional query pattern. Use * for wildcards; matching
+                is case-sensitive.
 
         Returns:
             List of matching keys.
         """
         try:
-            with sqlite3.connect(self._mdx_db) as conn:
-                if query:
-                    if "*" in query:
-                        query = query.replace("*", "%")
-                    else:
-                        query = query + "%"
-                    cursor = conn.execute(
-                        "SELECT key_text FROM MDX_INDEX WHERE key_text LIKE ?", (query,)
-                    )
-                    keys = [item[0] for item in cursor]
-                else:
-                    cursor = conn.execute("SELECT key_text FROM MDX_INDEX")
-                    keys = [item[0] for item in cursor]
-                return keys
+            return list(self.iter_mdx_keys(query))
         except sqlite3.Error as e:
             logging.error(f"Database error during MDX keys query '{query}': {e}")
             return []
@@ -5,26 +5,98 @@ MDX Dictionary Server - Modern Multi-Dictionary Implementation
 A high-performance HTTP server for MDX dictionary files with multi-dictionary support.
 """
 
+import gzip
 import json
 import logging
 import os
 import subprocess
 import sys
-from collections.abc import Callable
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from socketserver import ThreadingMixIn
 from typing import Any
-from urllib.parse import unquote
+from urllib.parse import unquote, unquote_to_bytes
 from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
 
 # Import dependencies
 from .config import ServerConfig, load_config
 from .file_util import file_util_get_ext
-from .mdx_util import get_definition_mdd
+from .mdx_util import get_definition_mdd, get_definition_mdd_any
 from .multi_dict_manager import MultiDictManager
 
+# Static response bodies, encoded once at import. Header lists stay per-call:
+# wsgiref's Headers wraps and mutates the list it is given.
+_NOT_FOUND_BODY = b"<h1>404 - Not Found</h1>"
+# MDD resources only change when the dictionary is replaced
+_RESOURCE_CACHE_CONTROL = "public, max-age=86400"
+# Small decoded resources (CSS, JS, icons, fonts) are kept in memory with
+# their ETag; larger bodies such as audio are decoded on every request
+_RESOURCE_CACHE_SIZE = 512
+_RESOURCE_CACHE_MAX_BODY = 256 * 1024
+# Text resources worth keeping a gzip copy of (ttf/eot are left alone: small
+# share of requests, and woff/woff2 are already compressed)
+_COMPRESSIBLE_TYPES = frozenset(
+    {
+        "text/html; charset=utf-8",
+        "text/css",
+        "application/javascript",
+        "image/svg+xml",
+    }
+)
+_GZIP_MIN_BODY = 1024
+# Most recent (route, word) lookups kept encoded when config.cache_enabled,
+# bounded by entry count and total bytes; very long entries are not kept
+_WORD_CACHE_SIZE = 4096
+_WORD_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_WORD_CACHE_MAX_ENTRY = 256 * 1024
+_UNHEALTHY_BODY = json.dumps(
+    {"status": "unhealthy", "dictionary": "not_loaded"}
+).encode()
+
+
+def _canon_resource_path(path: str) -> str:
+    """Canonical resource index key: '/' separators, no leading slash."""
+    return path.replace("\\", "/").lstrip("/")
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows a gzip response.
+
+    An explicit gzip/x-gzip entry decides; otherwise ``*`` does. Either
+    one is refused by ``q=0`` (RFC 9110 12.5.3).
+    """
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "x-gzip", "*"):
+            continue
+        accepted = True
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    accepted = float(value) > 0
+                except ValueError:
+                    accepted = False
+        if coding != "*":
+            return accepted
+        wildcard = accepted
+    return wildcard
+
 
 class ThreadedWSGIServer(ThreadingMixIn, WSGIServer):
-    """Multi-threaded WSGI server."""
+    """Multi-threaded WSGI server.
+
+    Connections are handled by a pool of at most ``max_threads`` reused
+    worker threads instead of one new thread per connection. While every
+    worker is busy the accept loop waits, so excess connections queue in
+    the listen backlog (``request_queue_size``) rather than in memory, and
+    each connection's socket times out after ``connection_timeout`` seconds
+    so idle clients cannot hold a worker indefinitely.
+    """
 
     allow_reuse_address = True
     daemon_threads = True
@@ -34,9 +106,47 @@ class ThreadedWSGIServer(ThreadingMixIn, WSGIServer):
         server_address: tuple[str, int],
         request_handler_class: type,
         max_threads: int = 20,
+        request_queue_size: int = 50,
+        connection_timeout: float | None = None,
     ) -> None:
+        # listen() backlog; must be set before the socket is activated
+        self.request_queue_size = request_queue_size
         super().__init__(server_address, request_handler_class)
         self.max_threads = max_threads
+        self.connection_timeout = connection_timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_threads, thread_name_prefix="mdx-http"
+        )
+        # One slot per worker: a connection is only taken off the backlog
+        # once a worker is free to run it
+        self._slots = threading.BoundedSemaphore(max_threads)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """Hand the connection to a pooled worker thread."""
+        self._slots.acquire()
+        try:
+            if self.connection_timeout:
+                request.settimeout(self.connection_timeout)
+            future = self._pool.submit(
+                self.process_request_thread, request, client_address
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._release_slot)
+
+    def _release_slot(self, _future: Any) -> None:
+        self._slots.release()
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # An idle client hitting connection_timeout is routine, not an error
+        if isinstance(sys.exc_info()[1], TimeoutError):
+            return
+        super().handle_error(request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
 
 class SilentWSGIRequestHandler(WSGIRequestHandler):
@@ -47,10 +157,21 @@ class SilentWSGIRequestHandler(WSGIRequestHandler):
 
 
 def make_threaded_server(
-    host: str, port: int, app: Any, max_threads: int = 20
+    host: str,
+    port: int,
+    app: Any,
+    max_threads: int = 20,
+    request_queue_size: int = 50,
+    connection_timeout: float | None = None,
 ) -> ThreadedWSGIServer:
     """Create a multi-threaded WSGI server."""
-    httpd = ThreadedWSGIServer((host, port), SilentWSGIRequestHandler, max_threads)
+    httpd = ThreadedWSGIServer(
+        (host, port),
+        SilentWSGIRequestHandler,
+        max_threads,
+        request_queue_size,
+        connection_timeout,
+    )
     httpd.set_app(app)
     return httpd
 
@@ -58,6 +179,23 @@ def make_threaded_server(
 class MDXServer:
     """Modern Multi-Dictionary MDX Server."""
 
+    # Fixed attribute set: request-path attribute loads skip the __dict__ probe
+    __slots__ = (
+        "config",
+        "multi_dict_manager",
+        "logger",
+        "_resource_index",
+        "_route_to_builder",
+        "_healthy_body",
+        "_dict_list_body",
+        "_log_debug",
+        "_resource_cache",
+        "_resource_cache_lock",
+        "_word_cache",
+        "_word_cache_bytes",
+        "_word_cache_lock",
+    )
+
     CONTENT_TYPES: dict[str, str] = {
         "html": "text/html; charset=utf-8",
         "js": "application/javascript",
@@ -83,8 +221,29 @@ class MDXServer:
         self.config = config
         self.multi_dict_manager = MultiDictManager(config)
         self.logger = self._setup_logging()
-        self._resource_index: dict[str, Any] = {}
-        self._route_handlers = self._init_route_handlers()
+        # Checked per request; skips the debug call entirely when disabled
+        self._log_debug = self.logger.isEnabledFor(logging.DEBUG)
+        # canonical path -> (dict_id, original MDD key or None if unknown)
+        self._resource_index: dict[str, tuple[str, str | None]] = {}
+        # Routes are fixed once dictionaries are loaded
+        self._route_to_builder = self.multi_dict_manager.builders_by_route
+        # Encoded API bodies; the dictionary set is fixed after startup
+        self._healthy_body = self._encode_health()
+        self._dict_list_body: bytes | None = None
+        # (dict_route, path) -> (body, etag, gzip body or None), LRU-ordered;
+        # only used when config.cache_enabled
+        self._resource_cache: OrderedDict[
+            tuple[str, str], tuple[bytes, str, bytes | None]
+        ] = OrderedDict()
+        self._resource_cache_lock = threading.Lock()
+        # (dict_route, word) -> (encoded entries, their total size), LRU-ordered;
+        # only used when config.cache_enabled. Dictionaries are read-only, so
+        # encoded entries can be reused as-is.
+        self._word_cache: OrderedDict[
+            tuple[str, str], tuple[tuple[bytes, ...], int]
+        ] = OrderedDict()
+        self._word_cache_bytes = 0
+        self._word_cache_lock = threading.Lock()
 
         if not self.multi_dict_manager.builders:
             raise RuntimeError("No dictionaries loaded - server cannot start")
@@ -99,70 +258,82 @@ class MDXServer:
         )
         return logging.getLogger(__name__)
 
-    def _init_route_handlers(self) -> dict[str, Callable]:
-        """Initialize route handlers mapping."""
-        return {
-            "/health": self._handle_health_check,
-            "/api/dicts": self._handle_dict_list,
-            "/api/dictionaries": self._handle_dict_list,
-        }
-
     def _build_resource_index(self) -> None:
         """Build reverse index for faster resource lookup using all available MDD resources."""
         self.logger.info("Building resource index...")
         total_resources = 0
+        builders = self.multi_dict_manager.builders
 
-        for dict_id, builder in self.multi_dict_manager.builders.items():
-            try:
-                # Get all MDD keys (resource paths) from this dictionary
-                if hasattr(builder, "get_mdd_keys"):
-                    mdd_keys = builder.get_mdd_keys()
-                    dict_resources = 0
-
-                    for key in mdd_keys:
-                        if key:
-                            # Normalize the key to a web path format
-                            # Convert \html\file.js to file.js, \file.js to file.js
-                            normalized_key = key.replace("\\", "/").strip("/")
-                            if normalized_key.startswith("html/"):
-                                normalized_key = normalized_key[
-                                    5:
-                                ]  # Remove 'html/' prefix
-
-                            # Only index if we don't already have this resource from another dict
-                            if normalized_key not in self._resource_index:
-                                # Verify the resource actually has content
-                                try:
-                                    result = get_definition_mdd(key, builder)
-                                    if result and result[0]:  # Has non-empty content
-                                        self._resource_index[normalized_key] = dict_id
-                                        dict_resources += 1
-                                except Exception:
-                                    continue
-
-                    self.logger.debug(
-                        f"Dictionary {dict_id}: indexed {dict_resources} resources"
-                    )
-                    total_resources += dict_resources
-                else:
-                    self.logger.warning(
-                        f"Dictionary {dict_id} doesn't support get_mdd_keys()"
-                    )
-
-            except Exception as e:
-                self.logger.debug(f"Error building index for {dict_id}: {e}")
+        # Dictionaries are independent, so scan their MDDs concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(builders))) as executor:
+            futures = [
+                executor.submit(self._index_one_dict, dict_id, builder)
+                for dict_id, builder in builders.items()
+            ]
+            # Merge in load order so earlier dictionaries keep precedence
+            for future in futures:
+                partial, dict_resources = future.result()
+                for path, entry in partial.items():
+                    self._resource_index.setdefault(path, entry)
+                total_resources += dict_resources
 
         self.logger.info(
-            f"Resource index built with {total_resources} entries from {len(self.multi_dict_manager.builders)} dictionaries"
+            f"Resource index built with {total_resources} entries from {len(builders)} dictionaries"
         )
 
+    def _index_one_dict(
+        self, dict_id: str, builder: Any
+    ) -> tuple[dict[str, tuple[str, str | None]], int]:
+        """Index the MDD resources of one dictionary.
+
+        Returns:
+            The partial resource index and the number of resources indexed.
+        """
+        index: dict[str, tuple[str, str | None]] = {}
+        dict_resources = 0
+        try:
+            # Get all MDD keys (resource paths) from this dictionary
+            if hasattr(builder, "iter_mdd_keys"):
+                mdd_keys = builder.iter_mdd_keys()
+            elif hasattr(builder, "get_mdd_keys"):
+                mdd_keys = builder.get_mdd_keys()
+            else:
+                self.logger.warning(
+                    f"Dictionary {dict_id} doesn't support get_mdd_keys()"
+                )
+                return index, 0
+
+            for key in mdd_keys:
+                if key:
+                    # Normalize the key to a web path format
+                    # Convert \html\file.js to file.js, \file.js to file.js
+                    full_key = _canon_resource_path(key).rstrip("/")
+                    normalized_key = full_key.removeprefix("html/")
+
+                    # Only index the first key that maps to this resource.
+                    # Content is verified lazily by _handle_mdd_resource.
+                    if normalized_key not in index:
+                        entry = (dict_id, key)
+                        index[normalized_key] = entry
+                        # Also serve html/file.js with one probe
+                        index.setdefault(full_key, entry)
+                        dict_resources += 1
+
+            self.logger.debug(
+                f"Dictionary {dict_id}: indexed {dict_resources} resources"
+            )
+        except Exception as e:
+            self.logger.debug(f"Error building index for {dict_id}: {e}")
+
+        return index, dict_resources
+
     def _validate_word(self, word: str) -> bool:
         """Validate word input for security."""
         if not word or len(word) > 100:
             return False
 
-        # Check for path traversal attempts
-        return not any(char in word for char in ["..", "/", "\\"])
+        # Check for path traversal attempts; plain `in` tests, no generator
+        return "/" not in word and "\\" not in word and ".." not in word
 
     def _get_content_type(self, file_path: str) -> str:
         """Get content type for a file."""
@@ -170,35 +341,56 @@ class MDXServer:
         return self.CONTENT_TYPES.get(ext, "text/html; charset=utf-8")
 
     def _handle_mdd_resource(
-        self, path_info: str, start_response: Any, dict_route: str = ""
+        self,
+        path_info: str,
+        start_response: Any,
+        dict_route: str = "",
+        builder: Any = None,
+        content_type: str | None = None,
+        accept_gzip: bool = False,
     ) -> list[bytes]:
-        """Handle MDD resource requests."""
-        try:
-            content_type = self._get_content_type(path_info)
-
-            builder = (
-                self.multi_dict_manager.get_dictionary_by_route(dict_route)
-                if dict_route
-                else self._find_resource_in_any_dictionary(path_info)
-            )
-
-            if builder:
-                # MDD resources use '\\' as a path separator internally, regardless of OS.
-                # We create a list of possible keys to try. The final normalization
-                # (e.g., 'css/style.css' -> 'css\style.css') is handled by get_definition_mdd.
-                search_paths = [
-                    path_info,
-                    f"\\{path_info}",
-                    f"\\html\\{path_info}",
-                ]
+        """Handle MDD resource requests.
 
-                for search_path in search_paths:
-                    result = get_definition_mdd(search_path, builder)
-                    if result and result[0]:
-                        start_response("200 OK", [("Content-Type", content_type)])
-                        return result
+        ``builder`` and ``content_type`` may be passed when the caller already
+        resolved the route and the extension. ``accept_gzip`` selects the
+        pre-compressed copy of cached text resources.
+        """
+        try:
+            if content_type is None:
+                content_type = self._get_content_type(path_info)
+
+            cache_enabled = self.config.cache_enabled
+            cache_key = (dict_route, path_info)
+            entry = None
+            if cache_enabled:
+                with self._resource_cache_lock:
+                    entry = self._resource_cache.get(cache_key)
+                    if entry is not None:
+                        self._resource_cache.move_to_end(cache_key)
+
+            if entry is None:
+                body = self._lookup_resource(path_info, dict_route, builder)
+                if body is None:
+                    return self._handle_not_found(start_response)
+                etag = f'W/"{len(body):x}-{zlib.crc32(body):08x}"'
+                if not cache_enabled or len(body) > _RESOURCE_CACHE_MAX_BODY:
+                    # Not kept, so not worth compressing for this one response
+                    entry = (body, etag, None)
+                else:
+                    # Compressed once here, then reused for every cached hit
+                    gz_body = (
+                        gzip.compress(body, compresslevel=9, mtime=0)
+                        if content_type in _COMPRESSIBLE_TYPES
+                        and len(body) >= _GZIP_MIN_BODY
+                        else None
+                    )
+                    entry = (body, etag, gz_body)
+                    with self._resource_cache_lock:
+                        self._resource_cache[cache_key] = entry
+                        if len(self._resource_cache) > _RESOURCE_CACHE_SIZE:
+                            self._resource_cache.popitem(last=False)
 
-            return self._handle_not_found(start_response)
+            return self._send_resource(entry, content_type, start_response, accept_gzip)
 
         except OSError as e:
             self.logger.error(f"MDD file access error: {e}")
@@ -207,53 +399,108 @@ class MDXServer:
             self.logger.error(f"MDD lookup error: {e}")
             return self._handle_error(start_response, "Resource lookup failed")
 
-    def _find_resource_in_any_dictionary(self, path_info: str):
-        """Find resource in any available dictionary using index for O(1) lookup."""
-        # Multiple normalization attempts for better cache hit rate
-        normalized_paths = [
-            path_info.lstrip("/"),  # Remove leading slashes
-            path_info.lstrip("/\\"),  # Remove leading slashes and backslashes
-            path_info.replace("\\", "/").lstrip("/"),  # Convert backslashes and strip
-        ]
+    def _lookup_resource(
+        self, path_info: str, dict_route: str, builder: Any
+    ) -> bytes | None:
+        """Read a resource body from the MDD, or None if no dictionary has it."""
+        mdd_key = None
+        if builder is None:
+            if dict_route:
+                builder = self.multi_dict_manager.get_dictionary_by_route(dict_route)
+            else:
+                builder, mdd_key = self._find_resource_in_any_dictionary(path_info)
+
+        # Indexed resources know their exact MDD key: one probe
+        if builder and mdd_key is not None:
+            result = get_definition_mdd(mdd_key, builder)
+            if result and result[0]:
+                return result[0]
+            # Indexed but empty: evict and search every dictionary instead
+            self._resource_index.pop(_canon_resource_path(path_info), None)
+            builder, _ = self._find_resource_in_any_dictionary(path_info)
+
+        if builder:
+            # MDD resources use '\\' as a path separator internally, regardless of OS.
+            # We create a list of possible keys to try in one lookup. The final
+            # normalization (e.g., 'css/style.css' -> 'css\style.css') is handled
+            # by get_definition_mdd_any.
+            search_paths = [
+                path_info,
+                f"\\{path_info}",
+                f"\\html\\{path_info}",
+            ]
 
-        # Remove duplicates while preserving order
-        normalized_paths = list(dict.fromkeys(normalized_paths))
+            result = get_definition_mdd_any(search_paths, builder)
+            if result and result[0]:
+                return result[0]
 
-        # Try indexed lookup first with all normalized paths
-        for normalized_path in normalized_paths:
-            if normalized_path in self._resource_index:
-                dict_id = self._resource_index[normalized_path]
-                if dict_id in self.multi_dict_manager.builders:
-                    return self.multi_dict_manager.builders[dict_id]
+        return None
 
-        # Fallback to linear search for unindexed resources
-        search_paths = [
-            path_info,
-            os.path.join("", path_info),
-            os.path.join("", "html", path_info),
+    def _send_resource(
+        self,
+        entry: tuple[bytes, str, bytes | None],
+        content_type: str,
+        start_response: Any,
+        accept_gzip: bool = False,
+    ) -> list[bytes]:
+        """Send a ``(body, etag, gzip_body)`` resource with a Content-Length.
+
+        The body is already in memory once the MDD record is decoded, so it
+        goes out as a single chunk; the length lets keep-alive clients reuse
+        the connection on servers that would otherwise not compute it. The
+        weak ETag lets browsers revalidate with If-None-Match.
+        """
+        body, etag, gz_body = entry
+        headers = [("Content-Type", content_type)]
+        if gz_body is not None:
+            if accept_gzip:
+                # Each encoding is a separate representation with its own ETag
+                body = gz_body
+                etag = f'{etag[:-1]}-gz"'
+                headers.append(("Content-Encoding", "gzip"))
+            headers.append(("Vary", "Accept-Encoding"))
+        headers += [
+            ("Content-Length", str(len(body))),
+            ("ETag", etag),
+            ("Cache-Control", _RESOURCE_CACHE_CONTROL),
         ]
+        start_response("200 OK", headers)
+        return [body]
+
+    def _find_resource_in_any_dictionary(
+        self, path_info: str
+    ) -> tuple[Any, str | None]:
+        """Find resource in any available dictionary using index for O(1) lookup.
+
+        Returns:
+            ``(builder, mdd_key)``; ``mdd_key`` is the exact MDD key when the
+            resource was indexed at startup, otherwise None. ``builder`` is
+            None when no dictionary has the resource.
+        """
+        # Index keys use the same canonical form, so one probe suffices
+        normalized_path = _canon_resource_path(path_info)
+        entry = self._resource_index.get(normalized_path)
+        if entry is not None:
+            dict_id, mdd_key = entry
+            builder = self.multi_dict_manager.builders.get(dict_id)
+            if builder is not None:
+                return builder, mdd_key
+
+        # Fallback to linear search for unindexed resources
+        search_paths = [path_info, os.path.join("html", path_info)]
 
-        for builder in self.multi_dict_manager.builders.values():
+        for dict_id, builder in self.multi_dict_manager.builders.items():
             try:
-                for search_path in search_paths:
-                    result = get_definition_mdd(search_path, builder)
-                    if result and result[0]:
-                        # Cache the found resource for future lookups using the original path
-                        dict_id = next(
-                            dict_id
-                            for dict_id, b in self.multi_dict_manager.builders.items()
-                            if b == builder
-                        )
-                        # Cache all normalized paths for better hit rate
-                        for norm_path in normalized_paths:
-                            if norm_path not in self._resource_index:
-                                self._resource_index[norm_path] = dict_id
-                        return builder
+                result = get_definition_mdd_any(search_paths, builder)
+                if result and result[0]:
+                    # Cache the found resource for future lookups
+                    self._resource_index.setdefault(normalized_path, (dict_id, None))
+                    return builder, None
             except OSError:
                 continue
             except Exception:
                 continue
-        return None
+        return None, None
 
     def _handle_word_lookup(
         self, word: str, start_response: Any, dict_route: str = ""
@@ -263,10 +510,10 @@ class MDXServer:
             return self._handle_error(start_response, "Invalid word")
 
         try:
-            results = self.multi_dict_manager.query_dictionary(dict_route, word)
+            results = self._lookup_word(dict_route, word)
             if results:
                 start_response("200 OK", [("Content-Type", "text/html; charset=utf-8")])
-                return [result.encode("utf-8") for result in results]
+                return list(results)
             else:
                 start_response(
                     "404 Not Found", [("Content-Type", "text/html; charset=utf-8")]
@@ -280,10 +527,44 @@ class MDXServer:
             self.logger.error(f"Word lookup error for '{word}': {e}")
             return self._handle_error(start_response, "Word lookup failed")
 
+    def _lookup_word(self, dict_route: str, word: str) -> tuple[bytes, ...]:
+        """Look up a word's encoded entries, through the word cache if enabled."""
+        if not self.config.cache_enabled:
+            return self._query_encoded(dict_route, word)
+
+        cache_key = (dict_route, word)
+        with self._word_cache_lock:
+            cached = self._word_cache.get(cache_key)
+            if cached is not None:
+                self._word_cache.move_to_end(cache_key)
+                return cached[0]
+
+        results = self._query_encoded(dict_route, word)
+        size = sum(map(len, results))
+        # Misses are not kept: query_dictionary also reports lookup errors as
+        # an empty result, and those must not outlive the error
+        if results and size <= _WORD_CACHE_MAX_ENTRY:
+            with self._word_cache_lock:
+                if cache_key not in self._word_cache:
+                    self._word_cache[cache_key] = (results, size)
+                    self._word_cache_bytes += size
+                    while (
+                        len(self._word_cache) > _WORD_CACHE_SIZE
+                        or self._word_cache_bytes > _WORD_CACHE_MAX_BYTES
+                    ):
+                        _, (_, evicted) = self._word_cache.popitem(last=False)
+                        self._word_cache_bytes -= evicted
+        return results
+
+    def _query_encoded(self, dict_route: str, word: str) -> tuple[bytes, ...]:
+        """Look up a word and return its entries encoded as UTF-8."""
+        results = self.multi_dict_manager.query_dictionary(dict_route, word)
+        return tuple(result.encode("utf-8") for result in results)
+
     def _handle_not_found(self, start_response: Any) -> list[bytes]:
         """Handle 404 not found."""
         start_response("404 Not Found", [("Content-Type", "text/html; charset=utf-8")])
-        return [b"<h1>404 - Not Found</h1>"]
+        return [_NOT_FOUND_BODY]
 
     def _handle_error(self, start_response: Any, message: str) -> list[bytes]:
         """Handle server errors."""
@@ -295,31 +576,41 @@ class MDXServer:
     def _handle_health_check(self, start_response: Any) -> list[bytes]:
         """Handle health check requests."""
         if self.multi_dict_manager.builders:
-            status_data = {
-                "status": "healthy",
-                "mode": "multi",
-                "dictionaries": len(self.multi_dict_manager.builders),
-            }
             start_response("200 OK", [("Content-Type", "application/json")])
-            return [json.dumps(status_data).encode()]
+            return [self._healthy_body]
         else:
-            status_data = {"status": "unhealthy", "dictionary": "not_loaded"}
             start_response(
                 "503 Service Unavailable", [("Content-Type", "application/json")]
             )
-            return [json.dumps(status_data).encode()]
+            return [_UNHEALTHY_BODY]
+
+    def _encode_health(self) -> bytes:
+        """Encode the healthy status body."""
+        status_data = {
+            "status": "healthy",
+            "mode": "multi",
+            "dictionaries": len(self.multi_dict_manager.builders),
+        }
+        return json.dumps(status_data).encode()
+
+    def _encode_dict_list(self) -> bytes:
+        """Encode the dictionary list body."""
+        dict_list = self.multi_dict_manager.get_dictionary_list()
+        response = {
+            "dictionaries": dict_list,
+            "mode": "multi",
+            "total": len(dict_list),
+        }
+        return json.dumps(response, ensure_ascii=False).encode("utf-8")
 
     def _handle_dict_list(self, start_response: Any) -> list[bytes]:
         """Handle dictionary list API requests."""
         try:
-            dict_list = self.multi_dict_manager.get_dictionary_list()
-            response = {
-                "dictionaries": dict_list,
-                "mode": "multi",
-                "total": len(dict_list),
-            }
+            body = self._dict_list_body
+            if body is None:
+                body = self._dict_list_body = self._encode_dict_list()
             start_response("200 OK", [("Content-Type", "application/json")])
-            return [json.dumps(response, ensure_ascii=False).encode("utf-8")]
+            return [body]
         except OSError as e:
             self.logger.error(f"Dictionary file access error: {e}")
             return self._handle_error(start_response, "Dictionary files not accessible")
@@ -332,13 +623,28 @@ class MDXServer:
     ) -> list[bytes]:
         """WSGI application handler with clean routing logic."""
         try:
-            path_info = unquote(
-                environ["PATH_INFO"].encode("iso8859-1").decode("utf-8")
-            )
-            self.logger.debug(f"Request: {path_info}")
+            raw_path = environ["PATH_INFO"]
+            if raw_path.isascii():
+                # Common case: no raw UTF-8 bytes to re-decode
+                path_info = unquote(raw_path)
+            else:
+                # WSGI hands over bytes as latin-1; percent-decode on bytes
+                # and decode UTF-8 once, replacing bad bytes like unquote()
+                path_info = unquote_to_bytes(raw_path.encode("iso8859-1")).decode(
+                    "utf-8", "replace"
+                )
+            if self._log_debug:
+                self.logger.debug("Request: %s", path_info)
 
             # Route the request using a clean dispatch system
-            return self._route_request(path_info, start_response)
+            accept_encoding = environ.get("HTTP_ACCEPT_ENCODING")
+            accept_gzip = bool(accept_encoding) and _accepts_gzip(accept_encoding)
+            if_none_match = environ.get("HTTP_IF_NONE_MATCH")
+            if if_none_match:
+                return self._route_conditional(
+                    path_info, start_response, if_none_match, accept_gzip
+                )
+            return self._route_request(path_info, start_response, accept_gzip)
 
         except UnicodeDecodeError as e:
             self.logger.error(f"Unicode decode error: {e}")
@@ -347,53 +653,125 @@ class MDXServer:
             self.logger.error(f"Application error: {e}")
             return self._handle_error(start_response, "Internal server error")
 
-    def _route_request(self, path_info: str, start_response: Any) -> list[bytes]:
+    def _route_conditional(
+        self,
+        path_info: str,
+        start_response: Any,
+        if_none_match: str,
+        accept_gzip: bool = False,
+    ) -> list[bytes]:
+        """Route a revalidation request, answering 304 when the ETag matches."""
+        # Weak comparison (RFC 9110 13.1.2): W/ prefixes are ignored
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        not_modified = False
+
+        def conditional_start_response(
+            status: str, headers: list[tuple[str, str]], exc_info: Any = None
+        ) -> Any:
+            nonlocal not_modified
+            if status.startswith("200"):
+                for name, value in headers:
+                    if name == "ETag" and (
+                        "*" in tags or value.removeprefix("W/") in tags
+                    ):
+                        not_modified = True
+                        # A 304 repeats the ETag and Vary the 200 would send
+                        return start_response(
+                            "304 Not Modified",
+                            [
+                                *(h for h in headers if h[0] in ("ETag", "Vary")),
+                                ("Cache-Control", _RESOURCE_CACHE_CONTROL),
+                            ],
+                        )
+            return start_response(status, headers, exc_info)
+
+        body = self._route_request(path_info, conditional_start_response, accept_gzip)
+        return [] if not_modified else body
+
+    def _route_request(
+        self, path_info: str, start_response: Any, accept_gzip: bool = False
+    ) -> list[bytes]:
         """Clean request routing with explicit handling for different types."""
         # Direct API routes
-        if path_info in self._route_handlers:
-            return self._route_handlers[path_info](start_response)
+        match path_info:
+            case "/health":
+                return self._handle_health_check(start_response)
+            case "/api/dicts" | "/api/dictionaries":
+                return self._handle_dict_list(start_response)
 
-        # Parse path components
+        # Locate the first separator instead of splitting the whole path
         clean_path = path_info.strip("/")
-        path_parts = clean_path.split("/") if clean_path else []
 
         # Empty path - show dictionary list
-        if not path_parts:
+        if not clean_path:
             return self._handle_dict_list(start_response)
 
         # Single component paths
-        if len(path_parts) == 1:
-            component = path_parts[0]
-            return self._handle_single_component(component, start_response)
+        slash = clean_path.find("/")
+        if slash < 0:
+            return self._handle_single_component(
+                clean_path, start_response, accept_gzip
+            )
 
         # Multi-component paths (dict_route/resource or dict_route/word)
-        return self._handle_multi_component(path_parts, start_response)
+        return self._handle_multi_component(
+            clean_path, slash, start_response, accept_gzip
+        )
 
     def _handle_single_component(
-        self, component: str, start_response: Any
+        self, component: str, start_response: Any, accept_gzip: bool = False
     ) -> list[bytes]:
         """Handle single path component (resource or word lookup)."""
-        # Check if it's a resource file
-        if file_util_get_ext(component) in self.CONTENT_TYPES:
-            return self._handle_mdd_resource(component, start_response)
+        # Check if it's a resource file; one table lookup serves both tests.
+        # The extension is sliced in place (a leading dot does not count).
+        dot = component.rfind(".")
+        content_type = self.CONTENT_TYPES.get(component[dot + 1 :]) if dot > 0 else None
+        if content_type is not None:
+            return self._handle_mdd_resource(
+                component,
+                start_response,
+                content_type=content_type,
+                accept_gzip=accept_gzip,
+            )
 
         # Otherwise it's a word lookup in default dictionary
         return self._handle_word_lookup(component, start_response, "")
 
     def _handle_multi_component(
-        self, path_parts: list[str], start_response: Any
+        self,
+        clean_path: str,
+        slash: int,
+        start_response: Any,
+        accept_gzip: bool = False,
     ) -> list[bytes]:
-        """Handle multi-component paths with dictionary routing."""
-        potential_route = path_parts[0]
-        remaining_path = "/".join(path_parts[1:])
+        """Handle multi-component paths with dictionary routing.
+
+        ``slash`` is the index of the first '/' in ``clean_path``.
+        """
+        potential_route = clean_path[:slash]
+        remaining_path = clean_path[slash + 1 :]
+        # Extension of the last component, sliced straight from clean_path
+        dot = clean_path.rfind(".")
+        content_type = (
+            self.CONTENT_TYPES.get(clean_path[dot + 1 :])
+            if dot > clean_path.rfind("/") + 1
+            else None
+        )
+        is_resource = content_type is not None
 
         # Check if first component is a valid dictionary route
-        if self.multi_dict_manager.get_dictionary_by_route(potential_route):
+        builder = self._route_to_builder.get(potential_route)
+        if builder:
             # Valid dictionary route
-            if file_util_get_ext(path_parts[-1]) in self.CONTENT_TYPES:
+            if is_resource:
                 # Resource request: /dict_route/path/to/resource.ext
                 return self._handle_mdd_resource(
-                    remaining_path, start_response, potential_route
+                    remaining_path,
+                    start_response,
+                    potential_route,
+                    builder,
+                    content_type,
+                    accept_gzip,
                 )
             else:
                 # Word lookup: /dict_route/word
@@ -402,9 +780,14 @@ class MDXServer:
                 )
 
         # Not a valid dictionary route, treat whole path as resource or return not found
-        full_path = "/".join(path_parts)
-        if file_util_get_ext(path_parts[-1]) in self.CONTENT_TYPES:
-            return self._handle_mdd_resource(full_path, start_response, "")
+        if is_resource:
+            return self._handle_mdd_resource(
+                clean_path,
+                start_response,
+                "",
+                content_type=content_type,
+                accept_gzip=accept_gzip,
+            )
 
         # Fallback: not found
         return self._handle_not_found(start_response)
@@ -427,12 +810,37 @@ class MDXServer:
                 f"Starting {self.config.server_type} server on {self.config.host}:{self.config.port}"
             )
 
-            if self.config.server_type == "threaded":
+            if self.config.server_type == "gevent":
+                try:
+                    from gevent.pywsgi import WSGIServer as GeventWSGIServer
+                except ImportError:
+                    self.logger.error(
+                        "gevent not found. Install with: pip install gevent"
+                    )
+                    self.logger.info("Falling back to threaded WSGI server...")
+                    self.config.server_type = "threaded"
+                    return self._run_wsgi_server()
+
+                # Accept/parse run on the gevent loop; one greenlet per connection.
+                # Nothing is monkey-patched and lookups do blocking sqlite3,
+                # mmap and file I/O, so greenlets run one request at a time.
+                httpd = GeventWSGIServer(
+                    (self.config.host, self.config.port),
+                    self.wsgi_application,
+                    log=None,
+                )
+                self.logger.info(
+                    f"gevent server ready at http://localhost:{self.config.port}/ "
+                    "(serves one request at a time; use 'threaded' for concurrency)"
+                )
+            elif self.config.server_type == "threaded":
                 httpd = make_threaded_server(
                     self.config.host,
                     self.config.port,
                     self.wsgi_application,
                     max_threads=self.config.max_threads,
+                    request_queue_size=self.config.request_queue_size,
+                    connection_timeout=self.config.connection_timeout,
                 )
                 self.logger.info(
                     f"Multi-threaded server (max_threads={self.config.max_threads}) ready at http://localhost:{self.config.port}/"
@@ -5,18 +5,21 @@ MDX Utility Functions - Refactored Version
 Improved utility functions for MDX dictionary processing.
 """
 
+import functools
 import logging
+import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 try:
-    from .file_util import file_util_get_files, file_util_is_ext, file_util_read_text
+    from .file_util import file_util_is_ext, file_util_read_text, iter_files
 except ImportError:
     # Handle missing file_util module gracefully
-    def file_util_get_files(root_dir: str | Path, result_list: list[str]) -> None:
+    def iter_files(root_dir: str | Path) -> Iterator[str]:
         """Stub implementation for file discovery."""
-        pass
+        return iter(())
 
     def file_util_is_ext(path: str | Path, ext: str) -> bool:
         """Stub implementation for extension checking."""
@@ -29,6 +32,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Redirect records look like "@@@LINK=target\r\n"
+_LINK_RE = re.compile(r"@@@LINK=([\w\s]*)")
+
 
 class LemmaProcessor:
     """Handle word lemmatization safely."""
@@ -44,12 +50,15 @@ class LemmaProcessor:
         This is a simplified version. For production, consider using
         libraries like spaCy, NLTK, or other NLP tools.
         """
-        if word in self._lemma_cache:
-            return self._lemma_cache[word]
+        # Cache on the normalized form so "Apples" and "apples" share an entry
+        key = word.lower().strip()
+        lemma = self._lemma_cache.get(key)
+        if lemma is not None:
+            return lemma
 
         # Simple lemmatization rules (expand as needed)
-        lemma = self._simple_lemmatize(word)
-        self._lemma_cache[word] = lemma
+        lemma = self._simple_lemmatize(key)
+        self._lemma_cache[key] = lemma
         return lemma
 
     def _simple_lemmatize(self, word: str) -> str:
@@ -100,7 +109,7 @@ class MDXContentProcessor:
             if not content:
                 lemma = self.lemma_processor.get_lemma(word)
                 if lemma != word:
-                    logger.debug(f"Trying lemma: {lemma} for word: {word}")
+                    logger.debug("Trying lemma: %s for word: %s", lemma, word)
                     content = builder.mdx_lookup(lemma)
 
             # Handle link references
@@ -110,9 +119,7 @@ class MDXContentProcessor:
                 processed_content = [f"<h1>No definition found for: {word}</h1>"]
 
             # Combine content and inject resources
-            final_content = self._combine_content_with_resources(processed_content)
-
-            return [final_content.encode("utf-8")]
+            return [self._combine_content_with_resources(processed_content)]
 
         except Exception as e:
             logger.error(f"Error processing word '{word}': {e}")
@@ -120,52 +127,64 @@ class MDXContentProcessor:
 
     def _process_content_links(self, content: list[str], builder: Any) -> list[str]:
         """Process @@@LINK= references in content."""
-        processed = []
-
+        # Collect link targets first so they can be resolved in one batch
+        links: list[str | None] = []
         for item in content:
-            # Check for link references
-            pattern = re.compile(r"@@@LINK=([\w\s]*)")
-            match = pattern.match(item)
-
-            if match:
-                link = match.group(1).strip()
-                logger.debug(f"Following link: {link}")
-                linked_content = builder.mdx_lookup(link)
-                processed.extend(linked_content)
-            else:
+            match = _LINK_RE.match(item)
+            links.append(match.group(1).strip() if match else None)
+
+        targets = [link for link in links if link is not None]
+        if not targets:
+            return content
+
+        logger.debug("Following links: %s", targets)
+        if hasattr(builder, "mdx_lookup_many"):
+            linked = builder.mdx_lookup_many(targets)
+        else:
+            linked = {link: builder.mdx_lookup(link) for link in targets}
+
+        processed = []
+        for item, link in zip(content, links, strict=True):
+            if link is None:
                 processed.append(item)
+            else:
+                processed.extend(linked.get(link, []))
 
         return processed
 
-    def _combine_content_with_resources(self, content: list[str]) -> str:
-        """Combine content with injected resources."""
+    def _combine_content_with_resources(self, content: list[str]) -> bytes:
+        """Combine content with injected resources into UTF-8 bytes."""
         # Join content
         main_content = "".join(content)
 
         # Clean up content
         main_content = main_content.replace("\r\n", "").replace("entry:/", "")
 
-        # Add injection resources
-        injection_html = self._get_injection_html()
+        # Add injection resources; only the entry itself is encoded per request
+        return main_content.encode("utf-8") + self._injection_html
+
+    @functools.cached_property
+    def _injection_html(self) -> bytes:
+        """UTF-8 HTML injection resources, read once and reused for every lookup."""
+        return self._get_injection_html().encode("utf-8")
 
-        return main_content + injection_html
+    def reload_injections(self) -> None:
+        """Drop the cached injection HTML so it is re-read on next lookup."""
+        self.__dict__.pop("_injection_html", None)
 
     def _get_injection_html(self) -> str:
         """Get HTML injection resources."""
-        injection_html = ""
+        parts: list[str] = []
 
         if not self.resource_path.exists():
-            return injection_html
+            return ""
 
         try:
-            injection_files: list[str] = []
-            file_util_get_files(str(self.resource_path), injection_files)
-
-            for file_path in injection_files:
+            # Stream paths from the walk; no intermediate list
+            for file_path in iter_files(self.resource_path):
                 if file_util_is_ext(file_path, "html"):
                     try:
-                        content = file_util_read_text(file_path)
-                        injection_html += content
+                        parts.append(file_util_read_text(file_path))
                     except Exception as e:
                         logger.warning(
                             f"Failed to read injection file {file_path}: {e}"
@@ -174,7 +193,7 @@ class MDXContentProcessor:
         except Exception as e:
             logger.warning(f"Failed to process injection files: {e}")
 
-        return injection_html
+        return "".join(parts)
 
     def get_definition_mdd(self, path: str, builder: Any) -> list[bytes]:
         """
@@ -187,30 +206,57 @@ class MDXContentProcessor:
         Returns:
             List of bytes containing the resource data
         """
-        if not path or not builder:
+        if not path:
+            return []
+        return self.get_definition_mdd_any([path], builder)
+
+    def get_definition_mdd_any(self, paths: list[str], builder: Any) -> list[bytes]:
+        """
+        Get MDD resource data for the first of several candidate paths.
+
+        All candidates are looked up in the MDD with one query; the
+        filesystem is only tried when none of them has content there.
+
+        Args:
+            paths: Candidate resource paths, in order of preference
+            builder: The MDX IndexBuilder instance
+
+        Returns:
+            List of bytes containing the resource data
+        """
+        paths = [path for path in paths if path]
+        if not paths or not builder:
             return []
 
         try:
             # Normalize path separators
-            normalized_path = path.replace("/", "\\")
-            content = builder.mdd_lookup(normalized_path)
-
-            if content and content[0]:  # Check if content is not empty
-                logger.debug(
-                    f"Found content in MDD for {path}, size: {len(content[0])}"
-                )
-                return [content[0]]
+            normalized_paths = [path.replace("/", "\\") for path in paths]
+            if hasattr(builder, "mdd_lookup_many"):
+                found = builder.mdd_lookup_many(normalized_paths)
             else:
-                logger.debug(
-                    f"MDD content empty or not found for {path}, trying filesystem fallback"
-                )
-                # Fallback: try to read from filesystem if MDD resource is empty or not found
-                return self._try_filesystem_fallback(path, builder)
-
+                found = {p: builder.mdd_lookup(p) for p in normalized_paths}
+
+            for path, normalized_path in zip(paths, normalized_paths, strict=True):
+                content = found.get(normalized_path)
+                if content and content[0]:  # Check if content is not empty
+                    logger.debug(
+                        "Found content in MDD for %s, size: %d", path, len(content[0])
+                    )
+                    return [content[0]]
+
+            logger.debug(
+                "MDD content empty or not found for %s, trying filesystem fallback",
+                paths,
+            )
         except Exception as e:
-            logger.error(f"Error getting MDD resource '{path}': {e}")
-            # Try filesystem fallback on error
-            return self._try_filesystem_fallback(path, builder)
+            logger.error(f"Error getting MDD resource '{paths}': {e}")
+
+        # Fallback: try to read from filesystem if MDD resource is empty or not found
+        for path in paths:
+            result = self._try_filesystem_fallback(path, builder)
+            if result and result[0]:
+                return result
+        return []
 
     def _try_filesystem_fallback(self, path: str, builder: Any) -> list[bytes]:
         """
@@ -224,26 +270,26 @@ class MDXContentProcessor:
             List of bytes containing the resource data from filesystem
         """
         try:
-            from pathlib import Path
-
             # Get the directory containing the MDX file
-            mdx_path = Path(builder._mdx_file)
-            dict_dir = mdx_path.parent
+            dict_dir = os.path.dirname(builder._mdx_file)
 
             # Clean the path - remove leading slashes and backslashes
             clean_path = path.lstrip("/\\")
 
             # Try to find the file in the same directory
-            resource_path = dict_dir / clean_path
+            resource_path = os.path.join(dict_dir, clean_path)
 
-            logger.debug(f"Trying filesystem path: {resource_path} (original: {path})")
+            logger.debug(
+                "Trying filesystem path: %s (original: %s)", resource_path, path
+            )
 
-            if resource_path.exists() and resource_path.is_file():
-                logger.debug(f"Found resource in filesystem: {resource_path}")
+            # One stat() answers both "exists" and "is a regular file"
+            if os.path.isfile(resource_path):
+                logger.debug("Found resource in filesystem: %s", resource_path)
                 with open(resource_path, "rb") as f:
                     return [f.read()]
             else:
-                logger.debug(f"Resource not found in filesystem: {resource_path}")
+                logger.debug("Resource not found in filesystem: %s", resource_path)
                 return []
 
         except Exception as e:
@@ -263,3 +309,8 @@ def get_definition_mdx(word: str, builder: Any) -> list[bytes]:
 def get_definition_mdd(path: str, builder: Any) -> list[bytes]:
     """Backward compatible function for MDD lookup."""
     return _processor.get_definition_mdd(path, builder)
+
+
+def get_definition_mdd_any(paths: list[str], builder: Any) -> list[bytes]:
+    """Module-level helper for MDD lookup over candidate paths."""
+    return _processor.get_definition_mdd_any(paths, builder)
@@ -4,7 +4,8 @@ Multi-Dictionary Manager for MDX Server.
 """
 
 import logging
-from pathlib import Path
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from .config import DictConfig, ServerConfig
 from .mdict_query import IndexBuilder
@@ -16,6 +17,8 @@ class MultiDictManager:
     def __init__(self, config: ServerConfig) -> None:
         self.config = config
         self.builders: dict[str, IndexBuilder] = {}
+        # route -> builder, rebuilt by load_dictionaries() for O(1) routing
+        self._builders_by_route: dict[str, IndexBuilder] = {}
         self.dict_configs: dict[str, DictConfig] = config.dictionaries.copy()
 
         # Auto-discover dictionaries
@@ -27,25 +30,65 @@ class MultiDictManager:
 
     def load_dictionaries(self) -> None:
         """Load all enabled dictionaries."""
+        # Relative paths resolve against the working directory, read once
+        cwd = os.getcwd()
+        enabled: list[tuple[str, DictConfig, str]] = []
         for dict_id, dict_config in self.dict_configs.items():
             if not dict_config.enabled:
                 continue
 
             # Handle relative and absolute paths
-            dict_path = Path(dict_config.path)
-            if not dict_path.is_absolute():
-                dict_path = Path.cwd() / dict_path
+            dict_path = os.path.join(cwd, dict_config.path)
 
-            if not dict_path.exists():
+            if not os.path.exists(dict_path):
                 logging.warning(f"Dictionary file not found: {dict_path}")
                 continue
-
-            try:
-                builder = IndexBuilder(dict_path)
-                self.builders[dict_id] = builder
-                logging.info(f"Loaded dictionary: {dict_id} ({dict_config.name})")
-            except Exception as e:
-                logging.error(f"Failed to load dictionary {dict_id}: {e}")
+            enabled.append((dict_id, dict_config, dict_path))
+
+        if not enabled:
+            self._index_routes()
+            return
+
+        # Dictionaries are independent; open (and if needed index) them in
+        # parallel, then register in config order so the first stays default.
+        # Only one builder per file runs concurrently: two would race to
+        # create the same index database.
+        mmap_size = self.config.sqlite_mmap_size
+        with ThreadPoolExecutor(max_workers=min(8, len(enabled))) as executor:
+            futures = {}
+            for _, _, dict_path in enabled:
+                if dict_path not in futures:
+                    futures[dict_path] = executor.submit(
+                        IndexBuilder, dict_path, mmap_size=mmap_size
+                    )
+
+            claimed: set[str] = set()
+            for dict_id, dict_config, dict_path in enabled:
+                try:
+                    builder = futures[dict_path].result()
+                    if dict_path in claimed:
+                        # Same file under another id: its index now exists
+                        builder = IndexBuilder(dict_path, mmap_size=mmap_size)
+                    claimed.add(dict_path)
+                    self.builders[dict_id] = builder
+                    logging.info(f"Loaded dictionary: {dict_id} ({dict_config.name})")
+                except Exception as e:
+                    logging.error(f"Failed to load dictionary {dict_id}: {e}")
+
+        self._index_routes()
+
+    @property
+    def builders_by_route(self) -> dict[str, IndexBuilder]:
+        """Loaded builders keyed by their non-empty route (do not mutate)."""
+        return self._builders_by_route
+
+    def _index_routes(self) -> None:
+        """Map each route to its loaded builder; the first configured wins."""
+        by_route: dict[str, IndexBuilder] = {}
+        for dict_id, dict_config in self.dict_configs.items():
+            if dict_config.route and dict_id in self.builders:
+                by_route.setdefault(dict_config.route, self.builders[dict_id])
+        self._builders_by_route = by_route
 
     def get_dictionary_by_route(self, route: str) -> IndexBuilder | None:
         """Get dictionary by route."""
@@ -59,11 +102,7 @@ class MultiDictManager:
             return None
 
         # Find dictionary matching the route
-        for dict_id, dict_config in self.dict_configs.items():
-            if dict_config.route == route and dict_id in self.builders:
-                return self.builders[dict_id]
-
-        return None
+        return self._builders_by_route.get(route)
 
     def get_dictionary_by_id(self, dict_id: str) -> IndexBuilder | None:
         """Get dictionary by ID."""
@@ -12,11 +12,30 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
+import os
 import re
 import sys
 import zlib
-from io import BytesIO
-from struct import unpack
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from struct import Struct
+
+# <Dict attr="value" ...> header attributes
+_HEADER_ATTR_RE = re.compile(rb'(\w+)="(.*?)"', re.DOTALL)
+# `N` stylesheet markers in MDX records
+_STYLE_TAG_RE = re.compile(r"`(\d+)`")
+# Adler-32 checksums and the header length are 4-byte integers
+_U32_BE = Struct(">I")
+_U32_LE = Struct("<I")
+# Key section header: block count, entry count, [info decompressed size,]
+# info size, key block size
+_KEY_HEADER_V2 = Struct(">5Q")
+_KEY_HEADER_V1 = Struct(">4I")
+# Record blocks inflated ahead of the consumer; 1 worker means inline
+_INFLATE_WORKERS = min(4, os.cpu_count() or 1)
+_INFLATE_AHEAD = 2 * _INFLATE_WORKERS
 
 
 # Note: Encryption support has been removed as encrypted MDX files are not supported
@@ -30,6 +49,9 @@ def _unescape_entities(text: bytes) -> bytes:
     Returns:
         Bytes with entities unescaped
     """
+    # Most header values carry no entities at all
+    if b"&" not in text:
+        return text
     return (
         text.replace(b"&lt;", b"<")
         .replace(b"&gt;", b">")
@@ -44,9 +66,12 @@ class MDict:
     It has no public methods and serves only as code sharing base class.
     """
 
-    def __init__(self, fname, encoding=""):
+    def __init__(self, fname, encoding="", verify=False):
         self._fname = fname
         self._encoding = encoding.upper()
+        # Adler-32 checks over whole decompressed key blocks; off by default
+        # since zlib already rejects corrupt streams
+        self._verify = verify
 
         self.header = self._read_header()
         try:
@@ -69,13 +94,13 @@ class MDict:
         return (key_value for key_id, key_value in self._key_list)
 
     def _read_number(self, f):
-        return unpack(self._number_format, f.read(self._number_width))[0]
+        return self._number_struct.unpack(f.read(self._number_width))[0]
 
     def _parse_header(self, header):
         """
         extract attributes from <Dict attr="value" ... >
         """
-        taglist = re.findall(rb'(\w+)="(.*?)"', header, re.DOTALL)
+        taglist = _HEADER_ATTR_RE.findall(header)
         tagdict = {}
         for key, value in taglist:
             tagdict[key] = _unescape_entities(value)
@@ -89,8 +114,9 @@ class MDict:
             # decompress
             key_block_info = zlib.decompress(key_block_info_compressed[8:])
             # adler checksum
-            adler32 = unpack(">I", key_block_info_compressed[4:8])[0]
-            assert adler32 == zlib.adler32(key_block_info) & 0xFFFFFFFF
+            if self._verify:
+                adler32 = _U32_BE.unpack_from(key_block_info_compressed, 4)[0]
+                assert adler32 == zlib.adler32(key_block_info) & 0xFFFFFFFF
         else:
             # no compression
             key_block_info = key_block_info_compressed
@@ -106,42 +132,36 @@ class MDict:
             byte_format = ">B"
             byte_width = 1
             text_term = 0
-
-        while i < len(key_block_info):
+        # precompiled formats read in place, without slicing the buffer
+        unpack_number = self._number_struct.unpack_from
+        unpack_size = Struct(byte_format).unpack_from
+        number_width = self._number_width
+        char_width = 2 if self._encoding == "UTF-16" else 1
+
+        info_size = len(key_block_info)
+        while i < info_size:
             # number of entries in current key block
-            num_entries += unpack(
-                self._number_format, key_block_info[i : i + self._number_width]
-            )[0]
-            i += self._number_width
+            num_entries += unpack_number(key_block_info, i)[0]
+            i += number_width
             # text head size
-            text_head_size = unpack(byte_format, key_block_info[i : i + byte_width])[0]
+            text_head_size = unpack_size(key_block_info, i)[0]
             i += byte_width
             # text head
-            if self._encoding != "UTF-16":
-                i += text_head_size + text_term
-            else:
-                i += (text_head_size + text_term) * 2
+            i += (text_head_size + text_term) * char_width
             # text tail size
-            text_tail_size = unpack(byte_format, key_block_info[i : i + byte_width])[0]
+            text_tail_size = unpack_size(key_block_info, i)[0]
             i += byte_width
             # text tail
-            if self._encoding != "UTF-16":
-                i += text_tail_size + text_term
-            else:
-                i += (text_tail_size + text_term) * 2
+            i += (text_tail_size + text_term) * char_width
             # key block compressed size
-            key_block_compressed_size = unpack(
-                self._number_format, key_block_info[i : i + self._number_width]
-            )[0]
-            i += self._number_width
+            key_block_compressed_size = unpack_number(key_block_info, i)[0]
+            i += number_width
             # key block decompressed size
-            key_block_decompressed_size = unpack(
-                self._number_format, key_block_info[i : i + self._number_width]
-            )[0]
-            i += self._number_width
-            key_block_info_list += [
+            key_block_decompressed_size = unpack_number(key_block_info, i)[0]
+            i += number_width
+            key_block_info_list.append(
                 (key_block_compressed_size, key_block_decompressed_size)
-            ]
+            )
 
         assert num_entries == self._num_entries
 
@@ -150,13 +170,12 @@ class MDict:
     def _decode_key_block(self, key_block_compressed, key_block_info_list):
         key_list = []
         i = 0
-        for compressed_size, _decompressed_size in key_block_info_list:
+        compressed_view = memoryview(key_block_compressed)
+        for compressed_size, decompressed_size in key_block_info_list:
             start = i
             end = i + compressed_size
             # 4 bytes : compression type
             key_block_type = key_block_compressed[start : start + 4]
-            # 4 bytes : adler checksum of decompressed key block
-            adler32 = unpack(">I", key_block_compressed[start + 4 : start + 8])[0]
             if key_block_type == b"\x00\x00\x00\x00":
                 key_block = key_block_compressed[start + 8 : end]
             elif key_block_type == b"\x01\x00\x00\x00":
@@ -166,56 +185,67 @@ class MDict:
                     "Please use a more modern MDX file format with zlib compression."
                 )
             elif key_block_type == b"\x02\x00\x00\x00":
-                # decompress key block
-                key_block = zlib.decompress(key_block_compressed[start + 8 : end])
+                # decompress key block straight from the shared buffer into
+                # an output sized from the block info
+                key_block = zlib.decompress(
+                    compressed_view[start + 8 : end], bufsize=decompressed_size
+                )
             # extract one single key block into a key list
-            key_list += self._split_key_block(key_block)
+            key_list.extend(self._split_key_block(key_block))
             # notice that adler32 returns signed value
-            assert adler32 == zlib.adler32(key_block) & 0xFFFFFFFF
+            if self._verify:
+                # 4 bytes : adler checksum of decompressed key block
+                adler32 = _U32_BE.unpack_from(key_block_compressed, start + 4)[0]
+                assert adler32 == zlib.adler32(key_block) & 0xFFFFFFFF
 
             i += compressed_size
         return key_list
 
     def _split_key_block(self, key_block):
         key_list = []
+        unpack_number = self._number_struct.unpack_from
+        number_width = self._number_width
+        # key text ends with '\x00'
+        if self._encoding == "UTF-16":
+            delimiter = b"\x00\x00"
+            width = 2
+        else:
+            delimiter = b"\x00"
+            width = 1
+        block_size = len(key_block)
         key_start_index = 0
-        while key_start_index < len(key_block):
-            # temp = key_block[key_start_index : key_start_index + self._number_width]  # Unused
+        while key_start_index < block_size:
             # the corresponding record's offset in record block
-            key_id = unpack(
-                self._number_format,
-                key_block[key_start_index : key_start_index + self._number_width],
-            )[0]
-            # key text ends with '\x00'
-            if self._encoding == "UTF-16":
-                delimiter = b"\x00\x00"
-                width = 2
+            key_id = unpack_number(key_block, key_start_index)[0]
+            text_start = key_start_index + number_width
+            # C-level search for the terminator; UTF-16 needs it code-unit aligned
+            key_end_index = key_block.find(delimiter, text_start)
+            while key_end_index >= 0 and (key_end_index - text_start) % width:
+                key_end_index = key_block.find(delimiter, key_end_index + 1)
+            if key_end_index < 0:
+                key_end_index = block_size
+            raw_text = key_block[text_start:key_end_index]
+            if width == 1 and raw_text.isascii():
+                # ASCII bytes read the same in every single-byte-unit MDX
+                # encoding (UTF-8, GB18030, Big5), so no round-trip is needed
+                key_text = raw_text.strip()
             else:
-                delimiter = b"\x00"
-                width = 1
-            i = key_start_index + self._number_width
-            while i < len(key_block):
-                if key_block[i : i + width] == delimiter:
-                    key_end_index = i
-                    break
-                i += width
-            key_text = (
-                key_block[key_start_index + self._number_width : key_end_index]
-                .decode(self._encoding, errors="ignore")
-                .encode("utf-8")
-                .strip()
-            )
+                key_text = (
+                    raw_text.decode(self._encoding, errors="ignore")
+                    .encode("utf-8")
+                    .strip()
+                )
             key_start_index = key_end_index + width
-            key_list += [(key_id, key_text)]
+            key_list.append((key_id, key_text))
         return key_list
 
     def _read_header(self):
         with open(self._fname, "rb") as f:
             # number of bytes of header text
-            header_bytes_size = unpack(">I", f.read(4))[0]
+            header_bytes_size = _U32_BE.unpack(f.read(4))[0]
             header_bytes = f.read(header_bytes_size)
             # 4 bytes: adler32 checksum of header, in little endian
-            adler32 = unpack("<I", f.read(4))[0]
+            adler32 = _U32_LE.unpack(f.read(4))[0]
             assert adler32 == zlib.adler32(header_bytes) & 0xFFFFFFFF
             # mark down key block offset
             self._key_block_offset = f.tell()
@@ -265,6 +295,7 @@ class MDict:
         else:
             self._number_width = 8
             self._number_format = ">Q"
+        self._number_struct = Struct(self._number_format)
 
         return header_tag
 
@@ -273,31 +304,28 @@ class MDict:
             f.seek(self._key_block_offset)
 
             # read key block header information
-            if self._version >= 2.0:
-                num_bytes = 8 * 5
-            else:
-                num_bytes = 4 * 4
-            block = f.read(num_bytes)
-
             # Note: Encryption handling removed - files are treated as unencrypted
-
-            # decode this block
-            sf = BytesIO(block)
-            # number of key blocks
-            num_key_blocks = self._read_number(sf)
-            # number of entries
-            self._num_entries = self._read_number(sf)
-            # number of bytes of key block info after decompression
             if self._version >= 2.0:
-                self._read_number(sf)  # key_block_info_decomp_size (unused)
-            # number of bytes of key block info
-            key_block_info_size = self._read_number(sf)
-            # number of bytes of key block
-            key_block_size = self._read_number(sf)
+                block = f.read(_KEY_HEADER_V2.size)
+                (
+                    num_key_blocks,  # number of key blocks
+                    self._num_entries,  # number of entries
+                    _,  # key_block_info_decomp_size (unused)
+                    key_block_info_size,  # number of bytes of key block info
+                    key_block_size,  # number of bytes of key block
+                ) = _KEY_HEADER_V2.unpack(block)
+            else:
+                block = f.read(_KEY_HEADER_V1.size)
+                (
+                    num_key_blocks,
+                    self._num_entries,
+                    key_block_info_size,
+                    key_block_size,
+                ) = _KEY_HEADER_V1.unpack(block)
 
             # 4 bytes: adler checksum of previous 5 numbers
             if self._version >= 2.0:
-                adler32 = unpack(">I", f.read(4))[0]
+                adler32 = _U32_BE.unpack(f.read(4))[0]
                 assert adler32 == (zlib.adler32(block) & 0xFFFFFFFF)
 
             # read key block info, which indicates key block's compressed and
@@ -316,9 +344,10 @@ class MDict:
         return key_list
 
     def _read_keys_brutal(self):
-        with open(self._fname, "rb") as f:
-            f.seek(self._key_block_offset)
-
+        with (
+            open(self._fname, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
             # the following numbers could be encrypted, disregard them!
             if self._version >= 2.0:
                 num_bytes = 8 * 5 + 4
@@ -326,177 +355,210 @@ class MDict:
             else:
                 num_bytes = 4 * 4
                 key_block_type = b"\x01\x00\x00\x00"
-            f.read(num_bytes)  # block (unused)
+            info_start = self._key_block_offset + num_bytes
 
             # key block info
             # 4 bytes '\x02\x00\x00\x00'
             # 4 bytes adler32 checksum
             # unknown number of bytes follows until '\x02\x00\x00\x00' which marks
             # the beginning of key block
-            key_block_info = f.read(8)
             if self._version >= 2.0:
-                assert key_block_info[:4] == b"\x02\x00\x00\x00"
-            while True:
-                fpos = f.tell()
-                t = f.read(1024)
-                index = t.find(key_block_type)
-                if index != -1:
-                    key_block_info += t[:index]
-                    f.seek(fpos + index)
-                    break
-                else:
-                    key_block_info += t
+                assert mm[info_start : info_start + 4] == b"\x02\x00\x00\x00"
+            key_block_start = mm.find(key_block_type, info_start + 8)
+            if key_block_start == -1:
+                raise ValueError("Key block start marker not found")
+            key_block_info = mm[info_start:key_block_start]
 
             key_block_info_list = self._decode_key_block_info(key_block_info)
-            key_block_size = sum(list(zip(*key_block_info_list, strict=False))[0])
+            key_block_size = sum(size for size, _ in key_block_info_list)
 
             # read key block
-            key_block_compressed = f.read(key_block_size)
+            key_block_end = key_block_start + key_block_size
+            key_block_compressed = mm[key_block_start:key_block_end]
             # extract key block
             key_list = self._decode_key_block(key_block_compressed, key_block_info_list)
 
-            self._record_block_offset = f.tell()
+            self._record_block_offset = key_block_end
 
         self._num_entries = len(key_list)
         return key_list
 
+    def _read_record_block_info(self, f):
+        """Read the record section header; return (compressed, decompressed) sizes."""
+        num_record_blocks = self._read_number(f)
+        num_entries = self._read_number(f)
+        assert num_entries == self._num_entries
+        record_block_info_size = self._read_number(f)
+        _ = self._read_number(f)  # record_block_size unused
+
+        # record block info section: one read, unpacked as pairs of numbers
+        assert num_record_blocks * self._number_width * 2 == record_block_info_size
+        numbers = (
+            n
+            for (n,) in self._number_struct.iter_unpack(f.read(record_block_info_size))
+        )
+        return list(zip(numbers, numbers, strict=True))
+
+    @staticmethod
+    def _record_block_type(mm, pos):
+        """Return the compression type (0 none, 2 zlib) of the block at mm[pos]."""
+        # 4 bytes: compression type
+        record_block_type = mm[pos : pos + 4]
+
+        if record_block_type == b"\x00\x00\x00\x00":
+            return 0
+        if record_block_type == b"\x02\x00\x00\x00":
+            return 2
+        if record_block_type == b"\x01\x00\x00\x00":
+            # LZO compression is no longer supported
+            raise RuntimeError(
+                "LZO compressed record block detected. LZO support has been removed. "
+                "Please use a more modern MDX file format with zlib compression."
+            )
+        raise ValueError(f"Unknown compression type: {record_block_type}")
+
+    def _read_record_block(self, mm, pos, end, decompressed_size):
+        """Return the data of the record block stored at mm[pos:end]."""
+        if self._record_block_type(mm, pos) == 0:
+            # no compression
+            return mm[pos + 8 : end]
+        # zlib compression; decompressed size is known up front.
+        # The view is a temporary so no export outlives the map.
+        return zlib.decompress(memoryview(mm)[pos + 8 : end], bufsize=decompressed_size)
+
+    def _iter_record_blocks(self, mm, pos, record_block_info_list):
+        """
+        Yield the data of each record block in order, starting at mm[pos].
+
+        Blocks are independent and zlib releases the GIL while inflating, so
+        on multi-core machines the next few blocks are decompressed on a
+        small pool while the caller splits the current one. At most
+        _INFLATE_AHEAD blocks are held beyond the one being consumed.
+        Callers must close this generator before closing the map.
+        """
+        if _INFLATE_WORKERS < 2:
+            for compressed_size, decompressed_size in record_block_info_list:
+                end = pos + compressed_size
+                yield self._read_record_block(mm, pos, end, decompressed_size)
+                pos = end
+            return
+
+        pool = ThreadPoolExecutor(
+            max_workers=_INFLATE_WORKERS, thread_name_prefix="mdict-inflate"
+        )
+        try:
+            pending = deque()
+            for compressed_size, decompressed_size in record_block_info_list:
+                end = pos + compressed_size
+                pending.append(
+                    pool.submit(
+                        self._read_record_block, mm, pos, end, decompressed_size
+                    )
+                )
+                pos = end
+                if len(pending) > _INFLATE_AHEAD:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # waits for in-flight blocks, so none still reads the map
+            pool.shutdown(cancel_futures=True)
+
     def _process_record_blocks(self):
         """
         Common generator method to process record blocks.
         Yields (record_block_data, compressed_size, decompressed_size) tuples.
         """
-        with open(self._fname, "rb") as f:
+        with (
+            open(self._fname, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
             f.seek(self._record_block_offset)
+            record_block_info_list = self._read_record_block_info(f)
 
-            num_record_blocks = self._read_number(f)
-            num_entries = self._read_number(f)
-            assert num_entries == self._num_entries
-            record_block_info_size = self._read_number(f)
-            _ = self._read_number(f)  # record_block_size unused
-
-            # record block info section
-            record_block_info_list = []
-            size_counter = 0
-            for _ in range(num_record_blocks):
-                compressed_size = self._read_number(f)
-                decompressed_size = self._read_number(f)
-                record_block_info_list.append((compressed_size, decompressed_size))
-                size_counter += self._number_width * 2
-            assert size_counter == record_block_info_size
-
-            # process actual record blocks
-            for compressed_size, decompressed_size in record_block_info_list:
-                record_block_compressed = f.read(compressed_size)
-                # 4 bytes: compression type
-                record_block_type = record_block_compressed[:4]
-
-                if record_block_type == b"\x00\x00\x00\x00":
-                    # no compression
-                    record_block = record_block_compressed[8:]
-                elif record_block_type == b"\x01\x00\x00\x00":
-                    # LZO compression is no longer supported
-                    raise RuntimeError(
-                        "LZO compressed record block detected. LZO support has been removed. "
-                        "Please use a more modern MDX file format with zlib compression."
-                    )
-                elif record_block_type == b"\x02\x00\x00\x00":
-                    # zlib compression
-                    record_block = zlib.decompress(record_block_compressed[8:])
-                else:
-                    raise ValueError(f"Unknown compression type: {record_block_type}")
-
-                yield record_block, compressed_size, decompressed_size
+            # process actual record blocks, sliced straight out of the map
+            blocks = self._iter_record_blocks(mm, f.tell(), record_block_info_list)
+            with closing(blocks):
+                for (compressed_size, decompressed_size), record_block in zip(
+                    record_block_info_list, blocks, strict=True
+                ):
+                    yield record_block, compressed_size, decompressed_size
 
     def _generate_index_info(self, check_block=True):
         """
         Common generator method to create index information for both MDX and MDD.
         Yields tuples of (index_dict, record_block_data) for each key entry.
         """
-        with open(self._fname, "rb") as f:
+        with (
+            open(self._fname, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
             f.seek(self._record_block_offset)
-
-            num_record_blocks = self._read_number(f)
-            num_entries = self._read_number(f)
-            assert num_entries == self._num_entries
-            record_block_info_size = self._read_number(f)
-            _ = self._read_number(f)  # record_block_size unused
-
-            # record block info section
-            record_block_info_list = []
-            size_counter = 0
-            for _ in range(num_record_blocks):
-                compressed_size = self._read_number(f)
-                decompressed_size = self._read_number(f)
-                record_block_info_list += [(compressed_size, decompressed_size)]
-                size_counter += self._number_width * 2
-            assert size_counter == record_block_info_size
+            record_block_info_list = self._read_record_block_info(f)
 
             # actual record block
             offset = 0
             i = 0
             size_counter = 0
-            for compressed_size, decompressed_size in record_block_info_list:
-                current_pos = f.tell()
-                record_block_compressed = f.read(compressed_size)
-                # 4 bytes: compression type
-                record_block_type = record_block_compressed[:4]
-                # 4 bytes: adler32 checksum of decompressed record block
-                adler32 = unpack(">I", record_block_compressed[4:8])[0]
-
-                if record_block_type == b"\x00\x00\x00\x00":
-                    _type = 0
-                    if check_block:
-                        record_block = record_block_compressed[8:]
-                elif record_block_type == b"\x01\x00\x00\x00":
-                    # LZO compression is no longer supported
-                    raise RuntimeError(
-                        "LZO compressed record block detected. LZO support has been removed. "
-                        "Please use a more modern MDX file format with zlib compression."
-                    )
-                elif record_block_type == b"\x02\x00\x00\x00":
-                    _type = 2
-                    if check_block:
-                        record_block = zlib.decompress(record_block_compressed[8:])
-
-                # notice that adler32 return signed value
-                if check_block:
-                    assert adler32 == zlib.adler32(record_block) & 0xFFFFFFFF
-                    assert len(record_block) == decompressed_size
-
-                # split record block according to the offset info from key block
-                while i < len(self._key_list):
-                    index_dict = {}
-                    index_dict["file_pos"] = current_pos
-                    index_dict["compressed_size"] = compressed_size
-                    index_dict["decompressed_size"] = decompressed_size
-                    index_dict["record_block_type"] = _type
-                    record_start, key_text = self._key_list[i]
-                    index_dict["record_start"] = record_start
-                    index_dict["key_text"] = key_text.decode("utf-8")
-                    index_dict["offset"] = offset
-
-                    # reach the end of current record block
-                    if record_start - offset >= decompressed_size:
-                        break
-                    # record end index
-                    if i < len(self._key_list) - 1:
-                        record_end = self._key_list[i + 1][0]
-                    else:
-                        record_end = decompressed_size + offset
-                    index_dict["record_end"] = record_end
-                    i += 1
-
-                    # yield the data needed for different subclasses
-                    record_data = None
+            # hoisted out of the per-entry loop below
+            key_list = self._key_list
+            num_keys = len(key_list)
+            last_key = num_keys - 1
+            # Without check_block only the 4-byte type of each record block is
+            # touched; the block bodies are never paged in
+            current_pos = f.tell()
+            # (the generator does no work until first advanced)
+            blocks = self._iter_record_blocks(mm, current_pos, record_block_info_list)
+            with closing(blocks):
+                for compressed_size, decompressed_size in record_block_info_list:
+                    end = current_pos + compressed_size
+                    _type = self._record_block_type(mm, current_pos)
+
+                    # notice that adler32 return signed value
                     if check_block:
-                        record_data = record_block[
-                            record_start - offset : record_end - offset
-                        ]
-
-                    yield index_dict, record_data
-
-                offset += decompressed_size
-                size_counter += compressed_size
+                        record_block = next(blocks)
+                        # 4 bytes: adler32 checksum of decompressed record block
+                        adler32 = _U32_BE.unpack_from(mm, current_pos + 4)[0]
+                        assert adler32 == zlib.adler32(record_block) & 0xFFFFFFFF
+                        assert len(record_block) == decompressed_size
+
+                    # split record block according to the offset info from key block
+                    block_end = offset + decompressed_size
+                    while i < num_keys:
+                        record_start, key_text = key_list[i]
+                        # reach the end of current record block
+                        if record_start >= block_end:
+                            break
+                        # record end index
+                        if i < last_key:
+                            record_end = key_list[i + 1][0]
+                        else:
+                            record_end = block_end
+                        i += 1
+
+                        index_dict = {
+                            "file_pos": current_pos,
+                            "compressed_size": compressed_size,
+                            "decompressed_size": decompressed_size,
+                            "record_block_type": _type,
+                            "record_start": record_start,
+                            "key_text": key_text.decode("utf-8"),
+                            "offset": offset,
+                            "record_end": record_end,
+                        }
+
+                        # yield the data needed for different subclasses
+                        record_data = None
+                        if check_block:
+                            record_data = record_block[
+                                record_start - offset : record_end - offset
+                            ]
+
+                        yield index_dict, record_data
+
+                    offset += decompressed_size
+                    size_counter += compressed_size
+                    current_pos = end
             # Record block size validation removed as variable is not used
 
     def _decode_records_common(self, process_record_func=None):
@@ -509,6 +571,9 @@ class MDict:
         """
         offset = 0
         i = 0
+        key_list = self._key_list
+        num_keys = len(key_list)
+        last_key = num_keys - 1
 
         for (
             record_block,
@@ -516,17 +581,18 @@ class MDict:
             _decompressed_size,
         ) in self._process_record_blocks():
             # split record block according to the offset info from key block
-            while i < len(self._key_list):
-                record_start, key_text = self._key_list[i]
+            block_end = offset + len(record_block)
+            while i < num_keys:
+                record_start, key_text = key_list[i]
                 # reach the end of current record block
-                if record_start - offset >= len(record_block):
+                if record_start >= block_end:
                     break
 
                 # record end index
-                if i < len(self._key_list) - 1:
-                    record_end = self._key_list[i + 1][0]
+                if i < last_key:
+                    record_end = key_list[i + 1][0]
                 else:
-                    record_end = len(record_block) + offset
+                    record_end = block_end
                 i += 1
 
                 record = record_block[record_start - offset : record_end - offset]
@@ -540,7 +606,7 @@ class MDict:
                 else:
                     yield key_text, record
 
-            offset += len(record_block)
+            offset = block_end
 
 
 class MDD(MDict):
@@ -553,8 +619,8 @@ class MDD(MDict):
     ... print filename, content[:10]
     """
 
-    def __init__(self, fname):
-        MDict.__init__(self, fname, encoding="UTF-16")
+    def __init__(self, fname, verify=False):
+        MDict.__init__(self, fname, encoding="UTF-16", verify=verify)
 
     def items(self):
         """Return a generator which in turn produce tuples in the form of (filename, content)"""
@@ -579,8 +645,8 @@ class MDX(MDict):
     ... print key, value[:10]
     """
 
-    def __init__(self, fname, encoding="", substyle=False):
-        MDict.__init__(self, fname, encoding)
+    def __init__(self, fname, encoding="", substyle=False, verify=False):
+        MDict.__init__(self, fname, encoding, verify)
         self._substyle = substyle
 
     def items(self):
@@ -589,27 +655,38 @@ class MDX(MDict):
 
     def _substitute_stylesheet(self, txt):
         # substitute stylesheet definition
-        txt_list = re.split(r"`\d+`", txt)
-        txt_tag = re.findall(r"`\d+`", txt)
-        txt_styled = txt_list[0]
-        for j, p in enumerate(txt_list[1:]):
-            style = self._stylesheet[txt_tag[j][1:-1]]
+        # One split with a capture group yields [text, tag, text, tag, ...]
+        parts = _STYLE_TAG_RE.split(txt)
+        styled = [parts[0]]
+        for j in range(1, len(parts), 2):
+            style = self._stylesheet[parts[j]]
+            p = parts[j + 1]
             if p and p[-1] == "\n":
-                txt_styled = txt_styled + style[0] + p.rstrip() + style[1] + "\r\n"
+                styled += (style[0], p.rstrip(), style[1], "\r\n")
             else:
-                txt_styled = txt_styled + style[0] + p + style[1]
-        return txt_styled
+                styled += (style[0], p, style[1])
+        return "".join(styled)
 
     def _process_mdx_record(self, record, key_text, encoding):
         """Process MDX record with text decoding and stylesheet substitution."""
-        # convert to utf-8
-        processed_record = (
-            record.decode(encoding, errors="ignore").strip("\x00").encode("utf-8")
-        )
-        # substitute styles
+        # substitute styles on the decoded text
         if self._substyle and self._stylesheet:
-            processed_record = self._substitute_stylesheet(processed_record)
-        return processed_record
+            text = record.decode(encoding, errors="ignore").strip("\x00")
+            return self._substitute_stylesheet(text).encode("utf-8")
+
+        if encoding == "UTF-8":
+            # NUL never occurs inside a multi-byte UTF-8 sequence, so valid
+            # records are already their own output once the padding is gone
+            record = record.strip(b"\x00")
+            try:
+                record.decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+            else:
+                return record
+
+        # convert to utf-8, dropping undecodable bytes
+        return record.decode(encoding, errors="ignore").strip("\x00").encode("utf-8")
 
     ### 获取 mdx 文件的索引列表，格式为
     ###  key_text(关键词，可以由后面的 keylist 得到)
@@ -628,15 +705,8 @@ class MDX(MDict):
         for index_dict, record_data in self._generate_index_info(check_block):
             # MDX-specific processing: handle record data if check_block is True
             if check_block and record_data is not None:
-                # convert to utf-8
-                record = (
-                    record_data.decode(self._encoding, errors="ignore")
-                    .strip("\x00")
-                    .encode("utf-8")
-                )
-                # substitute styles if enabled
-                if self._substyle and self._stylesheet:
-                    record = self._substitute_stylesheet(record)
+                # convert to utf-8 and substitute styles if enabled
+                self._process_mdx_record(record_data, None, self._encoding)
 
             index_dict_list.append(index_dict)
 